@@ -30,16 +30,17 @@ def main():
     print("-" * 50)
     
     try:
+        # Read file content once and share it with the parser
+        with open(file_path, 'rb') as f:
+            source_bytes = f.read()
+        code_content = source_bytes.decode('utf-8')
+        
         # Parse the code
-        analysis_results = analyze_code(file_path)
+        analysis_results = analyze_code(file_path, source_bytes=source_bytes)
         print(f"✓ Found {len(analysis_results['imports'])} imports")
         print(f"✓ Found {len(analysis_results['definitions'])} function definitions")
         print(f"✓ Found {len(analysis_results['calls'])} function calls")
         
-        # Read file content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            code_content = f.read()
-        
         # Generate AI summary
         print("\n🤖 Generating AI summary...")
         summary = get_ai_summary_sync(file_path, code_content, analysis_results)
@@ -4,29 +4,136 @@ Flask-based web interface for visualizing and exploring code analysis results
 """
 
 import os
+
+# Opt in to eventlet's cooperative server with DASHBOARD_ASYNC_MODE=eventlet.
+# CPU-heavy stages then run in eventlet's native thread pool (tpool) so the
+# hub keeps serving requests and Socket.IO events during an analysis.
+# Patching must happen before other imports. Forked workers deadlock in a
+# monkey-patched process, so they are spawned.
+ASYNC_MODE = 'threading'
+if os.getenv('DASHBOARD_ASYNC_MODE', '').lower() == 'eventlet':
+    import eventlet
+    import eventlet.tpool
+    eventlet.monkey_patch()
+    ASYNC_MODE = 'eventlet'
+
 import sys
 import json
+import math
+import hashlib
+import functools
+import time
+from collections import OrderedDict
 from pathlib import Path
 from flask import Flask, render_template, request, jsonify, send_file
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
+from cachetools import LFUCache
+import jinja2
+import numpy as np
+import networkx as nx
+import orjson
 import threading
+import multiprocessing
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.batch_analyzer import analyze_project, get_project_summary
 from services.dependency_analyzer import analyze_dependencies
-from services.visualization_service import generate_dependency_graph, export_graph_html
-from services.ai_service import analyze_project_architecture
+from services.visualization_service import (
+    create_network_graph,
+    energy_layout,
+    barnes_hut_layout,
+    generate_dependency_graph,
+    export_graph_html
+)
+from services.ai_service import analyze_project_architecture, get_client
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'code-cartographer-secret-key'
 CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=ASYNC_MODE)
+
+# Store analysis results in memory (in production, use Redis or database).
+# Bounded by approximate serialized size - least frequently used projects are
+# evicted first so hot projects stay resident in long-running dashboards.
+ANALYSIS_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+def _analysis_entry_size(entry):
+    """Approximate a cached project's size: its JSON plus the pre-encoded graph bytes"""
+    size = len(orjson.dumps(
+        {
+            key: value for key, value in entry.items()
+            if not key.endswith('_index') and key != 'graph_bytes'
+        },
+        default=str,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ))
+    return size + len(entry.get('graph_bytes', b''))
+
+
+# Entries carry their size, measured before insertion, so the cache never
+# re-serializes a project while analysis_cache_lock is held
+analysis_cache = LFUCache(maxsize=ANALYSIS_CACHE_MAX_BYTES, getsizeof=lambda entry: entry['cache_size'])
+# LFUCache is not thread-safe and even reads update its frequency counts, so
+# every access from request handlers and the analysis task holds this lock
+analysis_cache_lock = threading.Lock()
+
+# Chat context template, compiled once at import
+CONTEXT_TEMPLATE = jinja2.Environment(
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True
+).from_string("""Project Analysis Summary:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📊 Statistics:
+- Total Files: {{ batch['statistics']['total_files'] }}
+- Total Functions: {{ batch['statistics']['total_definitions'] }}
+- Total Imports: {{ batch['statistics']['total_imports'] }}
+- Total Dependencies: {{ deps['statistics']['total_dependencies'] }}
 
-# Store analysis results in memory (in production, use Redis or database)
-analysis_cache = {}
+📁 Files in Project:
+{% for file in files if file['status'] == 'success' %}
+
+{{ basename(file['file_path']) }}:
+{% if file['analysis']['definitions'] %}
+  Functions: {{ file['analysis']['definitions'][:10] | join(', ') }}
+{% endif %}
+{% if file['analysis']['imports'] %}
+  Imports: {{ file['analysis']['imports'][:10] | join(', ') }}
+{% endif %}
+{% endfor %}
+{% if deps['circular_dependencies'] %}
+
+⚠️ Circular Dependencies: {{ deps['circular_dependencies'] | length }} found
+{% endif %}
+{% if deps['hub_files'] %}
+
+🌟 Hub Files (Most Imported):
+{% for file, count in deps['hub_files'][:5] %}
+  - {{ basename(file) }} ({{ count }} imports)
+{% endfor %}
+{% endif %}
+{% if deps['orphaned_files'] %}
+
+🔌 Orphaned Files: {{ deps['orphaned_files'] | length }} files
+{% endif %}
+""")
+
+# Graph layouts keyed by topology hash, bounded to the most recent entries
+_LAYOUT_CACHE = OrderedDict()
+_LAYOUT_CACHE_SIZE = 32
+_layout_cache_lock = threading.Lock()
+
+
+def ojsonify(obj):
+    """Serialize a (large) payload with orjson into a JSON response"""
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+        mimetype='application/json'
+    )
 
 
 @app.route('/')
@@ -35,6 +142,12 @@ def index():
     return render_template('index.html')
 
 
+@functools.lru_cache(maxsize=128)
+def _path_ok(project_path, ts_bucket):
+    """Check that a project path is a directory, cached per 5-second bucket"""
+    return os.path.isdir(project_path)
+
+
 @app.route('/api/analyze', methods=['POST'])
 def analyze_project_api():
     """
@@ -44,18 +157,14 @@ def analyze_project_api():
     """
     data = request.json
     project_path = data.get('path')
-    exclude_patterns = data.get('exclude', ['node_modules', 'venv', '__pycache__', '.git'])
+    exclude_patterns = frozenset(data.get('exclude', ['node_modules', 'venv', '__pycache__', '.git']))
     
-    if not project_path or not os.path.exists(project_path):
+    if not project_path or not _path_ok(project_path, int(time.time() // 5)):
         return jsonify({'error': 'Invalid project path'}), 400
     
     try:
-        # Start analysis in background thread
-        thread = threading.Thread(
-            target=run_analysis,
-            args=(project_path, exclude_patterns)
-        )
-        thread.start()
+        # Start analysis as a background task (green thread under eventlet)
+        socketio.start_background_task(run_analysis, project_path, exclude_patterns)
         
         return jsonify({
             'status': 'started',
@@ -65,6 +174,19 @@ def analyze_project_api():
         return jsonify({'error': str(e)}), 500
 
 
+def run_blocking(func, *args, **kwargs):
+    """
+    Run CPU-bound work without stalling the server.
+    
+    Under eventlet the call runs in a native thread (eventlet.tpool) while
+    the hub keeps serving other green threads; in threading mode the
+    analysis already has its own thread, so the call runs inline.
+    """
+    if ASYNC_MODE == 'eventlet':
+        return eventlet.tpool.execute(func, *args, **kwargs)
+    return func(*args, **kwargs)
+
+
 def run_analysis(project_path, exclude_patterns):
     """Run analysis and emit progress via WebSocket"""
     try:
@@ -73,8 +195,24 @@ def run_analysis(project_path, exclude_patterns):
             'message': 'Scanning project files...'
         })
         
-        # Batch analysis
-        batch_results = analyze_project(project_path, exclude_patterns)
+        # Batch analysis - stream per-file progress as each file finishes
+        def file_progress(done, total, file_name):
+            socketio.emit('file_progress', {
+                'done': done,
+                'total': total,
+                'file': file_name
+            })
+            # Small projects are parsed serially on this green thread -
+            # let the hub serve requests between files
+            socketio.sleep(0)
+        
+        batch_results = analyze_project(
+            project_path,
+            exclude_patterns,
+            progress_callback=file_progress,
+            # Never fork the multi-threaded (or monkey-patched) server process
+            mp_context=multiprocessing.get_context('spawn')
+        )
         
         socketio.emit('analysis_progress', {
             'stage': 'dependencies',
@@ -82,69 +220,31 @@ def run_analysis(project_path, exclude_patterns):
         })
         
         # Dependency analysis
-        dep_results = analyze_dependencies(batch_results, project_path)
+        dep_results = run_blocking(analyze_dependencies, batch_results, project_path)
         
         socketio.emit('analysis_progress', {
             'stage': 'visualization',
             'message': 'Generating visualizations...'
         })
         
-        # Generate graph - convert to JSON format for frontend
-        from services.visualization_service import create_network_graph
-        import networkx as nx
-        
         # Create the network graph
-        G = create_network_graph(dep_results, project_path)
+        G = run_blocking(create_network_graph, dep_results, project_path)
         
         # Convert to JSON format for frontend
         if len(G.nodes()) > 0:
-            # Get positions using spring layout with better spacing
-            pos = nx.spring_layout(G, k=3, iterations=100, scale=2.0, center=(0, 0))
+            # Get positions (reused from cache when the topology is unchanged),
+            # warm-starting from the previous layout when re-analysing a project
+            with analysis_cache_lock:
+                previous = analysis_cache.get(os.path.basename(project_path))
+            previous_pos = None
+            if previous:
+                previous_pos = {
+                    node['id']: (node['x'], node['y'])
+                    for node in previous['graph']['nodes']
+                }
+            pos = compute_layout(G, previous_pos)
             
-            # Create a lookup for actual import/function counts from batch results
-            file_stats = {}
-            for file_result in batch_results['files']:
-                if file_result['status'] == 'success':
-                    file_path = file_result['file_path']
-                    analysis = file_result['analysis']
-                    file_stats[file_path] = {
-                        'imports': len(analysis.get('imports', [])),
-                        'functions': len(analysis.get('definitions', []))
-                    }
-            
-            # Create nodes data
-            nodes = []
-            for node in G.nodes():
-                node_data = G.nodes[node]
-                # Get actual counts from batch analysis
-                stats = file_stats.get(node, {'imports': 0, 'functions': 0})
-                functions_count = stats['functions']
-                imports_count = stats['imports']
-                
-                nodes.append({
-                    'id': node,
-                    'label': node_data.get('file_name', os.path.basename(node)),
-                    'x': float(pos[node][0]),
-                    'y': float(pos[node][1]),
-                    'size': min(functions_count * 10 + 20, 60),
-                    'color': '#4f46e5',
-                    'functions': functions_count,
-                    'imports': imports_count
-                })
-            
-            # Create edges data
-            edges = []
-            for source, target in G.edges():
-                edges.append({
-                    'source': source,
-                    'target': target,
-                    'x0': float(pos[source][0]),
-                    'y0': float(pos[source][1]),
-                    'x1': float(pos[target][0]),
-                    'y1': float(pos[target][1])
-                })
-            
-            graph_data = {'nodes': nodes, 'edges': edges}
+            graph_data = run_blocking(build_graph_data, G, pos, batch_results)
         else:
             graph_data = {'nodes': [], 'edges': []}
         
@@ -165,44 +265,227 @@ def run_analysis(project_path, exclude_patterns):
         
         # Cache results
         project_id = os.path.basename(project_path)
-        analysis_cache[project_id] = {
+        file_index, suffix_index = run_blocking(build_file_index, batch_results)
+        project_data = {
             'batch': batch_results,
             'dependencies': dep_results,
             'graph': graph_data,
-            'architecture': architecture_analysis
+            # Graph data is immutable after analysis - encode it once for the graph endpoint
+            'graph_bytes': orjson.dumps(graph_data, option=orjson.OPT_SERIALIZE_NUMPY),
+            'architecture': architecture_analysis,
+            'file_index': file_index,
+            'suffix_index': suffix_index,
+            'summary': get_project_summary(batch_results, dep_results)
         }
+        # Chat context only depends on the analysis, so build it once here
+        project_data['context'] = run_blocking(build_project_context, project_data)
+        project_data['cache_size'] = run_blocking(_analysis_entry_size, project_data)
+        with analysis_cache_lock:
+            analysis_cache[project_id] = project_data
         
         socketio.emit('analysis_complete', {
             'project_id': project_id,
-            'summary': get_project_summary(batch_results, dep_results)
+            'summary': project_data['summary']
         })
         
     except Exception as e:
         socketio.emit('analysis_error', {'error': str(e)})
 
 
+def build_graph_data(G, pos, batch_results):
+    """Convert the laid-out network graph into the frontend's node/edge JSON"""
+    # Create a lookup of (imports, functions) counts from batch results
+    file_stats = {
+        f['file_path']: (
+            len(f['analysis'].get('imports', [])),
+            len(f['analysis'].get('definitions', []))
+        )
+        for f in batch_results['files']
+        if f['status'] == 'success'
+    }
+    
+    # Convert all positions to Python floats in a single pass
+    node_list = list(G.nodes())
+    coords = np.array([pos[node] for node in node_list], dtype=float).tolist()
+    node_idx = {node: i for i, node in enumerate(node_list)}
+    
+    # Create nodes data
+    nodes = []
+    for node, (x, y) in zip(node_list, coords):
+        node_data = G.nodes[node]
+        # Get actual counts from batch analysis
+        imports_count, functions_count = file_stats.get(node, (0, 0))
+        
+        nodes.append({
+            'id': node,
+            'label': node_data.get('file_name', os.path.basename(node)),
+            'x': x,
+            'y': y,
+            'size': min(functions_count * 10 + 20, 60),
+            'color': '#4f46e5',
+            'functions': functions_count,
+            'imports': imports_count
+        })
+    
+    # Create edges data
+    edges = []
+    for source, target in G.edges():
+        x0, y0 = coords[node_idx[source]]
+        x1, y1 = coords[node_idx[target]]
+        edges.append({
+            'source': source,
+            'target': target,
+            'x0': x0,
+            'y0': y0,
+            'x1': x1,
+            'y1': y1
+        })
+    
+    return {'nodes': nodes, 'edges': edges}
+
+
+def build_file_index(batch_results):
+    """
+    Index file results by full path and by every trailing path suffix.
+    
+    Returns:
+        Tuple of ({file_path: result}, {'dir/file.py': result}) where the
+        suffix index keeps the first file for each suffix
+    """
+    file_index = {}
+    suffix_index = {}
+    for file_result in batch_results['files']:
+        file_path = file_result['file_path']
+        file_index[file_path] = file_result
+        
+        parts = file_path.replace(os.sep, '/').strip('/').split('/')
+        for i in range(len(parts)):
+            suffix_index.setdefault('/'.join(parts[i:]), file_result)
+    
+    return file_index, suffix_index
+
+
+def graph_topology_key(G):
+    """Hash the node and edge sets of a graph into a layout cache key"""
+    digest = hashlib.blake2b()
+    digest.update(repr(sorted(G.nodes())).encode('utf-8'))
+    digest.update(repr(sorted(G.edges())).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def compute_layout(G, previous_pos=None):
+    """
+    Compute node positions for the dashboard graph.
+    
+    Re-analysing a project whose files and imports are unchanged reuses the
+    cached positions instead of running the layout again. When the topology
+    changed, positions from the previous analysis (previous_pos) warm-start
+    the force-directed layouts so they converge in a few iterations.
+    """
+    key = graph_topology_key(G)
+    with _layout_cache_lock:
+        pos = _LAYOUT_CACHE.get(key)
+        if pos is not None:
+            _LAYOUT_CACHE.move_to_end(key)
+            return pos
+    
+    # Only nodes still in the graph can seed the layout
+    initial_pos = None
+    if previous_pos:
+        initial_pos = {node: previous_pos[node] for node in G if node in previous_pos} or None
+    
+    pos = run_blocking(_layout_positions, G, initial_pos)
+    
+    with _layout_cache_lock:
+        _LAYOUT_CACHE[key] = pos
+        while len(_LAYOUT_CACHE) > _LAYOUT_CACHE_SIZE:
+            _LAYOUT_CACHE.popitem(last=False)
+    
+    return pos
+
+
+def _layout_positions(G, initial_pos=None):
+    """Run the layout algorithm that suits the graph size"""
+    # Small graphs use spring layout, mid-sized ones minimize the layout
+    # energy with L-BFGS which converges faster and large ones use Barnes-Hut
+    # ForceAtlas2 (or a single sparse Laplacian eigensolve without fa2)
+    if len(G) > 200:
+        try:
+            pos = barnes_hut_layout(G, pos=initial_pos, iterations=100, scale=2.0, center=(0, 0))
+        except ImportError:
+            pos = nx.spectral_layout(G.to_undirected(), scale=2.0, center=(0, 0))
+    elif len(G) > 50:
+        pos = energy_layout(G, pos=initial_pos, maxiter=50, scale=2.0, center=(0, 0))
+    else:
+        if initial_pos:
+            iterations = 30
+        else:
+            iterations = min(100, max(30, int(20 * math.log2(len(G) + 2))))
+        pos = nx.spring_layout(
+            G, pos=initial_pos, k=3, iterations=iterations, scale=2.0, center=(0, 0)
+        )
+    
+    return pos
+
+
 @app.route('/api/projects')
 def list_projects():
     """List all analyzed projects"""
     projects = []
-    for project_id, data in analysis_cache.items():
-        summary = get_project_summary(data['batch'], data['dependencies'])
+    with analysis_cache_lock:
+        cached_projects = list(analysis_cache.items())
+    for project_id, data in cached_projects:
         projects.append({
             'id': project_id,
             'name': project_id,
-            'stats': summary
+            'stats': data['summary']
         })
     return jsonify(projects)
 
 
+@app.route('/api/batch', methods=['POST'])
+def batch_api():
+    """
+    Fetch several API routes in one round-trip
+    POST /api/batch
+    Body: {"routes": ["/api/project/services", "/api/project/services/graph"]}
+    Returns: {route: response_json}
+    """
+    data = request.json or {}
+    routes = data.get('routes')
+    
+    if not isinstance(routes, list):
+        return jsonify({'error': 'Missing routes list'}), 400
+    
+    adapter = app.url_map.bind('')
+    parts = []
+    for route in routes:
+        body = None
+        if isinstance(route, str) and route.startswith('/api/') and not route.startswith('/api/batch'):
+            try:
+                endpoint, args = adapter.match(route, method='GET')
+                body = app.make_response(app.view_functions[endpoint](**args)).get_data()
+            except Exception:
+                body = None
+        
+        if body is None:
+            body = orjson.dumps({'error': f'Route not allowed: {route}'})
+        
+        # Responses are already JSON - splice them together without re-encoding
+        parts.append(orjson.dumps(str(route)) + b':' + body)
+    
+    return app.response_class(b'{' + b','.join(parts) + b'}', mimetype='application/json')
+
+
 @app.route('/api/project/<project_id>')
 def get_project(project_id):
     """Get full analysis for a project"""
-    if project_id not in analysis_cache:
+    with analysis_cache_lock:
+        data = analysis_cache.get(project_id)
+    if data is None:
         return jsonify({'error': 'Project not found'}), 404
     
-    data = analysis_cache[project_id]
-    return jsonify({
+    return ojsonify({
         'id': project_id,
         'batch': data['batch'],
         'dependencies': data['dependencies'],
@@ -213,22 +496,28 @@ def get_project(project_id):
 @app.route('/api/project/<project_id>/graph')
 def get_project_graph(project_id):
     """Get dependency graph data"""
-    if project_id not in analysis_cache:
+    with analysis_cache_lock:
+        data = analysis_cache.get(project_id)
+    if data is None:
         return jsonify({'error': 'Project not found'}), 404
     
-    return jsonify(analysis_cache[project_id]['graph'])
+    return app.response_class(data['graph_bytes'], mimetype='application/json')
 
 
 @app.route('/api/project/<project_id>/file/<path:file_path>')
 def get_file_analysis(project_id, file_path):
     """Get analysis for a specific file"""
-    if project_id not in analysis_cache:
+    with analysis_cache_lock:
+        data = analysis_cache.get(project_id)
+    if data is None:
         return jsonify({'error': 'Project not found'}), 404
     
-    batch_data = analysis_cache[project_id]['batch']
-    for file_result in batch_data['files']:
-        if file_result['file_path'].endswith(file_path):
-            return jsonify(file_result)
+    file_result = (
+        data['file_index'].get(file_path)
+        or data['suffix_index'].get(file_path.replace(os.sep, '/').strip('/'))
+    )
+    if file_result:
+        return ojsonify(file_result)
     
     return jsonify({'error': 'File not found'}), 404
 
@@ -259,15 +548,14 @@ def chat():
     if not project_id or not user_message:
         return jsonify({'error': 'Missing project_id or message'}), 400
     
-    if project_id not in analysis_cache:
+    with analysis_cache_lock:
+        project_data = analysis_cache.get(project_id)
+    if project_data is None:
         return jsonify({'error': 'Project not found. Please analyze a project first.'}), 404
     
     try:
-        # Get project context
-        project_data = analysis_cache[project_id]
-        
-        # Build context for AI
-        context = build_project_context(project_data)
+        # Get project context (built once when the project was analyzed)
+        context = project_data['context']
         
         # Call Gemini with bounded context
         response = ask_gemini_about_project(user_message, context)
@@ -283,59 +571,21 @@ def build_project_context(project_data):
     batch = project_data['batch']
     deps = project_data['dependencies']
     
-    # Build comprehensive context
-    context = f"""Project Analysis Summary:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📊 Statistics:
-- Total Files: {batch['statistics']['total_files']}
-- Total Functions: {batch['statistics']['total_definitions']}
-- Total Imports: {batch['statistics']['total_imports']}
-- Total Dependencies: {deps['statistics']['total_dependencies']}
-
-📁 Files in Project:
-"""
-    
-    # Add file details with functions and imports
-    for file in batch['files'][:20]:  # Limit to first 20 files to avoid token limits
-        if file['status'] == 'success':
-            file_path = file['file_path']
-            analysis = file['analysis']
-            
-            context += f"\n{os.path.basename(file_path)}:\n"
-            
-            # List functions
-            if analysis.get('definitions'):
-                context += f"  Functions: {', '.join(analysis['definitions'][:10])}\n"
-            
-            # List imports
-            if analysis.get('imports'):
-                context += f"  Imports: {', '.join(analysis['imports'][:10])}\n"
-    
-    # Add dependency information
-    if deps.get('circular_dependencies'):
-        context += f"\n⚠️ Circular Dependencies: {len(deps['circular_dependencies'])} found\n"
-    
-    if deps.get('hub_files'):
-        context += f"\n🌟 Hub Files (Most Imported):\n"
-        for file, count in deps['hub_files'][:5]:
-            context += f"  - {os.path.basename(file)} ({count} imports)\n"
-    
-    if deps.get('orphaned_files'):
-        context += f"\n🔌 Orphaned Files: {len(deps['orphaned_files'])} files\n"
-    
-    return context
+    return CONTEXT_TEMPLATE.render(
+        batch=batch,
+        deps=deps,
+        files=batch['files'][:20],  # Limit to first 20 files to avoid token limits
+        basename=os.path.basename
+    )
 
 
 def ask_gemini_about_project(question, context):
     """Ask Gemini a question with project context - BOUNDED TO PROJECT ONLY"""
-    from google import genai
-    
-    api_key = os.getenv('GEMINI_API_KEY')
-    if not api_key:
+    try:
+        client = get_client()
+    except ValueError:
         return "Error: GEMINI_API_KEY not configured"
     
-    client = genai.Client(api_key=api_key)
-    
     system_prompt = f"""You are a helpful code analysis assistant for Code Cartographer. 
 
 🎯 YOUR SOLE PURPOSE: Answer questions about the SPECIFIC codebase that has been analyzed below.
@@ -14,6 +14,10 @@ socket.on('analysis_progress', (data) => {
     updateProgress(data);
 });
 
+socket.on('file_progress', (data) => {
+    updateFileProgress(data);
+});
+
 socket.on('analysis_complete', (data) => {
     hideProgress();
     loadProject(data.project_id);
@@ -105,8 +109,24 @@ async function loadProjectsList() {
 // Load project details
 async function loadProject(projectId) {
     try {
-        const response = await fetch(`/api/project/${projectId}`);
-        const data = await response.json();
+        // Fetch project details and graph in a single round-trip
+        const projectRoute = `/api/project/${projectId}`;
+        const graphRoute = `/api/project/${projectId}/graph`;
+        const response = await fetch('/api/batch', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                routes: [projectRoute, graphRoute]
+            })
+        });
+        const results = await response.json();
+        const data = results[projectRoute];
+        
+        if (!response.ok || data.error) {
+            throw new Error(data.error || results.error || 'Request failed');
+        }
         
         // Store project with ID for chat
         currentProject = { ...data, id: projectId };
@@ -118,7 +138,7 @@ async function loadProject(projectId) {
         displayStats(data.batch.statistics);
         
         // Display dependency graph
-        displayGraph(projectId);
+        displayGraph(results[graphRoute]);
         
         // Display architecture analysis
         displayArchitecture(data.architecture);
@@ -127,7 +147,7 @@ async function loadProject(projectId) {
         displayHubFiles(data.dependencies.hub_files);
         
         // Display circular dependencies
-        displayCircularDeps(data.dependencies.circular_dependencies);
+        displayCircularDeps(data.dependencies.circular_dependencies, data.dependencies.circular_components);
         
         // Scroll to details
         document.getElementById('projectDetails').scrollIntoView({ behavior: 'smooth' });
@@ -157,11 +177,8 @@ function displayStats(stats) {
 }
 
 // Display dependency graph
-async function displayGraph(projectId) {
+function displayGraph(graphData) {
     try {
-        const response = await fetch(`/api/project/${projectId}/graph`);
-        const graphData = await response.json();
-        
         if (!graphData || !graphData.nodes || graphData.nodes.length === 0) {
             document.getElementById('graphContainer').innerHTML = 
                 '<p class="empty-state">No dependencies found in this project</p>';
@@ -275,7 +292,7 @@ function displayHubFiles(hubFiles) {
 }
 
 // Display circular dependencies
-function displayCircularDeps(circularDeps) {
+function displayCircularDeps(circularDeps, circularComponents) {
     const container = document.getElementById('circularDepsContainer');
     
     if (!circularDeps || circularDeps.length === 0) {
@@ -283,11 +300,19 @@ function displayCircularDeps(circularDeps) {
         return;
     }
     
-    container.innerHTML = circularDeps.map(cycle => `
+    // Each cycle is one path through its component; list every file involved
+    container.innerHTML = circularDeps.map((cycle, i) => {
+        const members = (circularComponents && circularComponents[i]) || [];
+        const extra = members.length > new Set(cycle).size
+            ? `<div class="circular-members">Files involved: ${members.map(getFileName).join(', ')}</div>`
+            : '';
+        return `
         <div class="circular-item">
             ${cycle.map(getFileName).join(' → ')}
+            ${extra}
         </div>
-    `).join('');
+    `;
+    }).join('');
 }
 
 // Helper functions
@@ -313,6 +338,14 @@ function updateProgress(data) {
     document.getElementById('progressMessage').textContent = data.message;
 }
 
+function updateFileProgress(data) {
+    // Per-file progress fills the bar between the scanning and dependencies stages
+    const progress = 25 + Math.round(25 * data.done / data.total);
+    document.getElementById('progressBar').style.width = `${progress}%`;
+    document.getElementById('progressMessage').textContent =
+        `Analyzing files (${data.done}/${data.total}): ${data.file}`;
+}
+
 function hideProgress() {
     setTimeout(() => {
         document.getElementById('progressContainer').style.display = 'none';
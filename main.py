@@ -16,6 +16,7 @@ Usage:
 
 import sys
 import os
+import heapq
 import argparse
 from pathlib import Path
 from tqdm import tqdm
@@ -59,21 +60,22 @@ def analyze_single_file_mode(file_path: str):
         print_header()
         print_analysis_header(file_path)
         
-        # Step 1: Parse the code structure
-        print("🔍 Step 1/3: Parsing code structure with tree-sitter...")
-        analysis_results = analyze_code(file_path)
+        # Step 1: Read the file content (once, shared with the parser)
+        print("📖 Step 1/3: Reading file content...")
+        with open(file_path, 'rb') as f:
+            source_bytes = f.read()
+        code_content = source_bytes.decode('utf-8')
+        print(f"   ✓ Read {len(code_content)} characters\n")
+        
+        # Step 2: Parse the code structure
+        print("🔍 Step 2/3: Parsing code structure with tree-sitter...")
+        analysis_results = analyze_code(file_path, source_bytes=source_bytes)
         
         # Print quick stats
         print(f"   ✓ Found {len(analysis_results['imports'])} imports")
         print(f"   ✓ Found {len(analysis_results['definitions'])} function definitions")
         print(f"   ✓ Found {len(analysis_results['calls'])} function calls\n")
         
-        # Step 2: Read the file content
-        print("📖 Step 2/3: Reading file content...")
-        with open(file_path, 'r', encoding='utf-8') as f:
-            code_content = f.read()
-        print(f"   ✓ Read {len(code_content)} characters\n")
-        
         # Step 3: Generate AI summary
         print("🤖 Step 3/3: Generating AI-powered summary...")
         print("   (This may take 10-30 seconds...)\n")
@@ -122,16 +124,26 @@ def analyze_batch_mode(directory: str, exclude_patterns: str = None, cache: bool
         def progress_callback(current, total, filename):
             nonlocal pbar
             if pbar is None:
-                pbar = tqdm(total=total, desc="Analyzing files", unit="file")
+                # Let tqdm skip redraws; per-file terminal writes add up on large repos
+                pbar = tqdm(
+                    total=total,
+                    desc="Analyzing files",
+                    unit="file",
+                    mininterval=0.2,
+                    miniters=max(1, total // 200),
+                    smoothing=0.1
+                )
             pbar.update(1)
-            pbar.set_postfix_str(f"Current: {filename[:40]}")
+            if current & 31 == 0 or current == total:
+                pbar.set_postfix_str(f"Current: {filename[:40]}", refresh=False)
         
-        # Analyze project
+        # Analyze project, reusing cached results for unchanged files
+        cache_file = Path(directory) / '.cartographer_cache' / 'analysis.ndjson'
         results = analyze_project(
             directory,
             exclude_patterns=exclude_set,
-            max_workers=4,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            cache_file=str(cache_file) if cache else None
         )
         
         if pbar:
@@ -143,25 +155,23 @@ def analyze_batch_mode(directory: str, exclude_patterns: str = None, cache: bool
         
         # Save cache if requested
         if cache and results['status'] == 'success':
-            cache_dir = Path(directory) / '.cartographer_cache'
-            cache_file = cache_dir / 'analysis.json'
             save_analysis_cache(results, str(cache_file))
         
         # Show file breakdown
         print("\n📊 Top Files by Function Count:")
-        successful_files = [
-            f for f in results['files'] 
+        # Count each file's definitions once, for both ranking and display
+        counted_files = [
+            (len(f['analysis']['definitions']), f)
+            for f in results['files'] 
             if f['status'] == 'success'
         ]
-        sorted_files = sorted(
-            successful_files,
-            key=lambda x: len(x['analysis']['definitions']),
-            reverse=True
-        )[:10]
-        
-        for i, file_info in enumerate(sorted_files, 1):
-            func_count = len(file_info['analysis']['definitions'])
-            rel_path = os.path.relpath(file_info['file_path'], directory)
+        top_files = heapq.nlargest(10, counted_files, key=lambda pair: pair[0])
+        
+        # Scanned paths all sit under the resolved project root, so strip it as a prefix
+        base = os.path.join(str(Path(directory).resolve()), '')
+        for i, (func_count, file_info) in enumerate(top_files, 1):
+            file_path = file_info['file_path']
+            rel_path = file_path[len(base):] if file_path.startswith(base) else file_path
             print(f"  {i:2d}. {rel_path:50s} ({func_count} functions)")
         
         print("\n✅ Batch analysis complete!")
@@ -176,7 +186,8 @@ def analyze_batch_mode(directory: str, exclude_patterns: str = None, cache: bool
 
 
 def visualize_mode(directory: str, output: str = None, format: str = 'html', 
-                   exclude_patterns: str = None, architecture: bool = False):
+                   exclude_patterns: str = None, architecture: bool = False,
+                   all_cycles: bool = False):
     """Generate dependency graph visualizations."""
     try:
         print_header()
@@ -191,7 +202,7 @@ def visualize_mode(directory: str, output: str = None, format: str = 'html',
         
         # Step 1: Batch analyze
         print("🔍 Step 1/3: Analyzing project files...")
-        batch_results = analyze_project(directory, exclude_patterns=exclude_set, max_workers=4)
+        batch_results = analyze_project(directory, exclude_patterns=exclude_set)
         
         if batch_results['status'] != 'success':
             print("❌ Failed to analyze project")
@@ -201,7 +212,7 @@ def visualize_mode(directory: str, output: str = None, format: str = 'html',
         
         # Step 2: Build dependency graph
         print("🔗 Step 2/3: Building dependency graph...")
-        dep_analysis = analyze_dependencies(batch_results, directory)
+        dep_analysis = analyze_dependencies(batch_results, directory, all_cycles=all_cycles)
         dep_summary = get_dependency_summary(dep_analysis, directory)
         print(dep_summary)
         
@@ -326,6 +337,12 @@ def main():
         help='Include AI-powered architecture analysis'
     )
     
+    parser.add_argument(
+        '--all-cycles',
+        action='store_true',
+        help='List every import cycle, not just one per group of files'
+    )
+    
     # Parse arguments
     args = parser.parse_args()
     
@@ -350,7 +367,8 @@ def main():
             output=args.output,
             format=args.format,
             exclude_patterns=args.exclude,
-            architecture=args.architecture
+            architecture=args.architecture,
+            all_cycles=args.all_cycles
         )
     
     # Batch mode
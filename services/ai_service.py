@@ -6,6 +6,9 @@ a comprehensive, human-readable summary of the code file.
 """
 
 import os
+import asyncio
+import functools
+from typing import List, Tuple
 from google import genai
 from dotenv import load_dotenv
 
@@ -13,19 +16,17 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-def get_ai_summary_sync(file_path: str, code_content: str, analysis_results: dict) -> str:
+@functools.lru_cache(maxsize=1)
+def get_client() -> genai.Client:
     """
-    Generate an AI-powered summary of a code file.
+    Create the Gemini client once per process and reuse it across calls.
     
-    Args:
-        file_path: Path to the code file being analyzed
-        code_content: The full content of the code file
-        analysis_results: Dictionary with 'imports', 'definitions', and 'calls' lists
-        
     Returns:
-        A formatted string with the AI-generated analysis
+        A configured Gemini client
+        
+    Raises:
+        ValueError: If GEMINI_API_KEY is not set
     """
-    # Initialize Gemini client with new API
     api_key = os.getenv('GEMINI_API_KEY')
     if not api_key or api_key == 'your-api-key-here':
         raise ValueError(
@@ -33,12 +34,25 @@ def get_ai_summary_sync(file_path: str, code_content: str, analysis_results: dic
             "Get your key from: https://aistudio.google.com/app/apikey"
         )
     
-    client = genai.Client(api_key=api_key)
+    return genai.Client(api_key=api_key)
+
+
+def _build_summary_prompt(file_path: str, code_content: str, analysis_results: dict) -> str:
+    """
+    Build the Gemini prompt for summarizing a single code file.
     
+    Args:
+        file_path: Path to the code file being analyzed
+        code_content: The full content of the code file
+        analysis_results: Dictionary with 'imports', 'definitions', and 'calls' lists
+        
+    Returns:
+        The combined system and user prompt
+    """
     # Construct the detailed prompt
-    imports_list = "\n".join(f"  - {imp}" for imp in analysis_results.get('imports', []))
-    definitions_list = "\n".join(f"  - {defn}" for defn in analysis_results.get('definitions', []))
-    calls_list = "\n".join(f"  - {call}" for call in analysis_results.get('calls', []))
+    imports_list = "\n".join(["  - " + imp for imp in analysis_results.get('imports', ())])
+    definitions_list = "\n".join(["  - " + defn for defn in analysis_results.get('definitions', ())])
+    calls_list = "\n".join(["  - " + call for call in analysis_results.get('calls', ())])
     
     system_prompt = """You are a senior software engineer helping developers understand unfamiliar codebases. 
 Your job is to analyze code and provide clear, concise explanations that help developers quickly understand:
@@ -82,11 +96,28 @@ Please provide your analysis in the following format:
 If there are any notable patterns, potential issues, or architectural insights, mention them briefly at the end.
 """
 
+    return f"{system_prompt}\n\n{user_prompt}"
+
+
+def get_ai_summary_sync(file_path: str, code_content: str, analysis_results: dict) -> str:
+    """
+    Generate an AI-powered summary of a code file.
+    
+    Args:
+        file_path: Path to the code file being analyzed
+        code_content: The full content of the code file
+        analysis_results: Dictionary with 'imports', 'definitions', and 'calls' lists
+        
+    Returns:
+        A formatted string with the AI-generated analysis
+    """
+    client = get_client()
+    
     # Call Gemini API with new client
     try:
         response = client.models.generate_content(
             model='gemini-2.5-flash',
-            contents=f"{system_prompt}\n\n{user_prompt}"
+            contents=_build_summary_prompt(file_path, code_content, analysis_results)
         )
         
         # Extract and return the response
@@ -96,6 +127,57 @@ If there are any notable patterns, potential issues, or architectural insights,
         raise Exception(f"Error calling Gemini API: {str(e)}")
 
 
+def get_ai_summaries_sync(
+    files: List[Tuple[str, str, dict]],
+    max_concurrency: int = 8
+) -> List[str]:
+    """
+    Generate AI-powered summaries for many code files concurrently.
+    
+    Args:
+        files: List of (file_path, code_content, analysis_results) tuples
+        max_concurrency: Maximum number of Gemini requests in flight at once
+        
+    Returns:
+        List of summaries in the same order as files
+    """
+    return asyncio.run(get_ai_summaries_async(files, max_concurrency))
+
+
+async def get_ai_summaries_async(
+    files: List[Tuple[str, str, dict]],
+    max_concurrency: int = 8
+) -> List[str]:
+    """
+    Generate AI-powered summaries for many code files concurrently.
+    
+    Requests go through the async Gemini client, bounded by a semaphore so
+    a large project doesn't exceed the provider's rate limits.
+    
+    Args:
+        files: List of (file_path, code_content, analysis_results) tuples
+        max_concurrency: Maximum number of Gemini requests in flight at once
+        
+    Returns:
+        List of summaries in the same order as files
+    """
+    client = get_client()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def summarize_one(file_path: str, code_content: str, analysis_results: dict) -> str:
+        async with semaphore:
+            try:
+                response = await client.aio.models.generate_content(
+                    model='gemini-2.5-flash',
+                    contents=_build_summary_prompt(file_path, code_content, analysis_results)
+                )
+                return response.text
+            except Exception as e:
+                raise Exception(f"Error calling Gemini API for {file_path}: {str(e)}")
+    
+    return await asyncio.gather(*[summarize_one(*file) for file in files])
+
+
 def analyze_project_architecture(dependency_analysis: dict, batch_analysis: dict, project_root: str) -> str:
     """
     Generate AI-powered architecture analysis of entire project.
@@ -108,15 +190,7 @@ def analyze_project_architecture(dependency_analysis: dict, batch_analysis: dict
     Returns:
         AI-generated architectural insights
     """
-    # Initialize Gemini client with new API
-    api_key = os.getenv('GEMINI_API_KEY')
-    if not api_key or api_key == 'your-api-key-here':
-        raise ValueError(
-            "Gemini API key not found. Please set GEMINI_API_KEY in your .env file.\n"
-            "Get your key from: https://aistudio.google.com/app/apikey"
-        )
-    
-    client = genai.Client(api_key=api_key)
+    client = get_client()
     
     # Extract key information
     stats = batch_analysis['statistics']
@@ -124,6 +198,7 @@ def analyze_project_architecture(dependency_analysis: dict, batch_analysis: dict
     hub_files = dependency_analysis['hub_files'][:5]
     orphaned = dependency_analysis['orphaned_files'][:5]
     circular = dependency_analysis['circular_dependencies'][:3]
+    circular_components = dependency_analysis.get('circular_components', [])[:3]
     
     # Format hub files
     hub_list = "\n".join([
@@ -140,7 +215,11 @@ def analyze_project_architecture(dependency_analysis: dict, batch_analysis: dict
     # Format circular dependencies
     circular_list = "\n".join([
         f"  - {' → '.join([os.path.basename(f) for f in cycle])}"
-        for cycle in circular
+        + (
+            f" (files involved: {', '.join(os.path.basename(f) for f in members)})"
+            if len(members) > len(set(cycle)) else ""
+        )
+        for cycle, members in zip(circular, circular_components or [()] * len(circular))
     ])
     
     # Get sample file contents from important files
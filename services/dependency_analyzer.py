@@ -9,71 +9,235 @@ This service analyzes relationships between files:
 """
 
 import os
-from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
+import heapq
+from typing import Dict, List, Set, Tuple, Optional, FrozenSet
 from collections import defaultdict
 
+try:
+    import numpy as np
+    from scipy import sparse
+    from scipy.sparse import csgraph
+except ImportError:
+    # Fall back to the pure-Python graph passes
+    sparse = None
 
-def normalize_import_path(import_statement: str, file_path: str, project_root: str) -> Optional[str]:
+
+# Extensions tried for absolute (dotted) and relative imports, in priority order
+ABSOLUTE_IMPORT_EXTENSIONS = ('.py', '.js', '.ts')
+RELATIVE_IMPORT_EXTENSIONS = ('.py', '.js', '.ts', '.jsx', '.tsx', '')
+
+# Files that make a directory importable
+PACKAGE_INDEX_FILES = ('__init__.py', 'index.js', 'index.ts', 'index.jsx', 'index.tsx')
+
+def _list_files(directory: str, listings: Dict[str, FrozenSet[str]]) -> FrozenSet[str]:
+    """List the names of regular files in a directory, memoized in listings."""
+    names = listings.get(directory)
+    if names is None:
+        try:
+            with os.scandir(directory) as entries:
+                names = frozenset(entry.name for entry in entries if entry.is_file())
+        except OSError:
+            names = frozenset()
+        listings[directory] = names
+    return names
+
+
+def _is_file(path: str, listings: Dict[str, FrozenSet[str]]) -> bool:
+    """Check whether a path is an existing file using the memoized directory listings."""
+    directory, name = os.path.split(path)
+    return name in _list_files(directory, listings)
+
+
+def _with_suffix(path: str, ext: str) -> Optional[str]:
+    """Replace a path's suffix like Path.with_suffix, without building Path objects."""
+    directory, name = os.path.split(path)
+    if not name:
+        return None
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        name = name[:dot]
+    return os.path.join(directory, name + ext)
+
+
+def _relative_target(current_dir: str, import_statement: str) -> str:
+    """Build the base path of a relative import ('./utils', '../lib/x')."""
+    # Remove leading dots and convert to path
+    stripped = import_statement.lstrip('.')
+    target_path = current_dir
+    
+    # Go up directories for each extra dot
+    dots = len(import_statement) - len(stripped)
+    for _ in range(dots - 1):
+        target_path = os.path.dirname(target_path)
+    
+    # Join with the rest of the path
+    for part in stripped.split('/'):
+        if part and part != '.':
+            target_path = os.path.join(target_path, part)
+    
+    return target_path
+
+
+def normalize_import_path(
+    import_statement: str,
+    file_path: str,
+    project_root: str,
+    listings: Optional[Dict[str, FrozenSet[str]]] = None
+) -> Optional[str]:
     """
     Convert an import statement to an actual file path.
     
+    Existence checks are set lookups against directory listings instead of
+    stat calls. Pass the same listings dict to every call of one build to
+    list each directory only once, and drop it afterwards so later builds
+    see filesystem changes.
+    
     Args:
         import_statement: The import string (e.g., 'services.parser_service' or './utils')
         file_path: Path of the file containing the import
         project_root: Root directory of the project
+        listings: Directory listings shared across calls (default: fresh per call)
         
     Returns:
         Normalized file path or None if not found
     """
-    project_path = Path(project_root).resolve()
-    current_file = Path(file_path).resolve()
-    current_dir = current_file.parent
+    if listings is None:
+        listings = {}
+    
+    project_path = os.path.realpath(project_root)
+    current_dir = os.path.dirname(os.path.realpath(file_path))
     
     # Handle relative imports (JavaScript/TypeScript style)
     if import_statement.startswith('.'):
-        # Remove leading dots and convert to path
-        parts = import_statement.lstrip('.').split('/')
-        target_path = current_dir
-        
-        # Go up directories for each extra dot
-        dots = len(import_statement) - len(import_statement.lstrip('.'))
-        for _ in range(dots - 1):
-            target_path = target_path.parent
-        
-        # Join with the rest of the path
-        for part in parts:
-            if part:
-                target_path = target_path / part
+        target_path = _relative_target(current_dir, import_statement)
         
         # Try different extensions
-        for ext in ['.py', '.js', '.ts', '.jsx', '.tsx', '']:
-            test_path = target_path.with_suffix(ext)
-            if test_path.exists() and test_path.is_file():
-                return str(test_path)
+        for ext in RELATIVE_IMPORT_EXTENSIONS:
+            test_path = _with_suffix(target_path, ext)
+            if test_path is not None and _is_file(test_path, listings):
+                return test_path
             
             # Try as directory with __init__.py or index.js
-            if (target_path / '__init__.py').exists():
-                return str(target_path / '__init__.py')
-            for index_file in ['index.js', 'index.ts', 'index.jsx', 'index.tsx']:
-                if (target_path / index_file).exists():
-                    return str(target_path / index_file)
+            for index_file in PACKAGE_INDEX_FILES:
+                test_path = os.path.join(target_path, index_file)
+                if _is_file(test_path, listings):
+                    return test_path
     
     # Handle absolute imports (Python style)
     else:
         # Convert dots to path separators
-        parts = import_statement.split('.')
-        target_path = project_path / Path(*parts)
+        parts = [
+            part
+            for segment in import_statement.split('.')
+            for part in segment.split('/')
+            if part
+        ]
+        target_path = os.path.join(project_path, *parts)
         
         # Try different extensions
-        for ext in ['.py', '.js', '.ts']:
-            test_path = target_path.with_suffix(ext)
-            if test_path.exists() and test_path.is_file():
-                return str(test_path)
+        for ext in ABSOLUTE_IMPORT_EXTENSIONS:
+            test_path = _with_suffix(target_path, ext)
+            if test_path is not None and _is_file(test_path, listings):
+                return test_path
         
         # Try as directory with __init__.py
-        if (target_path / '__init__.py').exists():
-            return str(target_path / '__init__.py')
+        test_path = os.path.join(target_path, '__init__.py')
+        if _is_file(test_path, listings):
+            return test_path
+    
+    return None
+
+
+def build_module_index(file_paths, project_root: str) -> Dict[str, str]:
+    """
+    Index project files by the module names an absolute import would use.
+    
+    Each file is keyed by its dotted name ('pkg.mod') and by its
+    root-relative slash form ('pkg/mod', as in TS baseUrl imports).
+    Mirrors normalize_import_path's lookup order: 'pkg.mod' prefers
+    pkg/mod.py, then .js, then .ts, and finally pkg/mod/__init__.py.
+    
+    Args:
+        file_paths: Paths of all analyzed project files
+        project_root: Resolved root directory of the project
+        
+    Returns:
+        Dictionary mapping dotted and slash-form module names to file paths
+    """
+    ranked_modules = {}
+    package_index = {}
+    
+    for file_path in file_paths:
+        rel_path, ext = os.path.splitext(os.path.relpath(file_path, project_root))
+        parts = rel_path.split(os.sep)
+        # Imports split on dots, so dotted file/dir names (and '..') can't be reached
+        if ext not in ABSOLUTE_IMPORT_EXTENSIONS or any('.' in part for part in parts):
+            continue
+        
+        rank = ABSOLUTE_IMPORT_EXTENSIONS.index(ext)
+        for separator in ('.', '/'):
+            ranked_modules[(rank, separator.join(parts))] = file_path
+            if parts[-1] == '__init__' and ext == '.py' and len(parts) > 1:
+                package_index[separator.join(parts[:-1])] = file_path
+    
+    module_index = {}
+    for (_, module), file_path in sorted(ranked_modules.items()):
+        module_index.setdefault(module, file_path)
+    for module, file_path in package_index.items():
+        module_index.setdefault(module, file_path)
+    
+    return module_index
+
+
+def resolve_import(
+    import_statement: str,
+    current_dir: str,
+    module_index: Dict[str, str],
+    known_files: Set[str]
+) -> Optional[str]:
+    """
+    Resolve an import against the project's own files without touching the filesystem.
+    
+    Args:
+        import_statement: The import string (e.g., 'services.parser_service' or './utils')
+        current_dir: Resolved directory of the importing file
+        module_index: Index from build_module_index()
+        known_files: Set of all analyzed project file paths
+        
+    Returns:
+        Path of the imported project file or None if not found
+    """
+    # Absolute imports ('pkg.mod' or root-relative 'src/utils') are a dictionary lookup
+    if not import_statement.startswith('.'):
+        resolved = module_index.get(import_statement)
+        if resolved is None and not import_statement.startswith('/'):
+            # Mixed or doubled separators ('src/utils.helpers', 'a..b') name
+            # the same path as their dotted form
+            dotted = '.'.join(
+                part
+                for segment in import_statement.split('.')
+                for part in segment.split('/')
+                if part
+            )
+            if dotted != import_statement:
+                resolved = module_index.get(dotted)
+        return resolved
+    
+    # Relative imports (JavaScript/TypeScript style)
+    target_path = _relative_target(os.fspath(current_dir), import_statement)
+    
+    # Same candidate order as normalize_import_path, checked against the known files
+    base_path = _with_suffix(target_path, '.py')
+    if base_path is None:
+        return None
+    
+    candidates = [base_path]
+    candidates += [os.path.join(target_path, index_file) for index_file in PACKAGE_INDEX_FILES]
+    candidates += [_with_suffix(target_path, ext) for ext in RELATIVE_IMPORT_EXTENSIONS[1:]]
+    
+    for candidate in candidates:
+        if candidate in known_files:
+            return candidate
     
     return None
 
@@ -111,10 +275,20 @@ def build_dependency_graph(batch_analysis: Dict, project_root: str) -> Dict:
             'calls': analysis['calls']
         }
     
+    # Index the project's own files so imports resolve by dictionary lookup
+    project_path = os.path.realpath(project_root)
+    module_index = build_module_index(files_info, project_path)
+    known_files = set(files_info)
+    
+    # In-degree per file, in files_info order, shared by the orphan/hub/statistics passes
+    file_ids = {file_path: i for i, file_path in enumerate(files_info)}
+    in_degree = [0] * len(files_info)
+    
     # Second pass: resolve imports and build edges
     for file_path, file_info in files_info.items():
+        current_dir = os.path.dirname(os.path.realpath(file_path))
         for import_stmt in file_info['imports']:
-            resolved_path = normalize_import_path(import_stmt, file_path, project_root)
+            resolved_path = resolve_import(import_stmt, current_dir, module_index, known_files)
             
             if resolved_path and resolved_path in files_info:
                 # Add resolved import
@@ -122,6 +296,7 @@ def build_dependency_graph(batch_analysis: Dict, project_root: str) -> Dict:
                 
                 # Add to imported_by list of the target file
                 files_info[resolved_path]['imported_by'].append(file_path)
+                in_degree[file_ids[resolved_path]] += 1
                 
                 # Add edge to graph
                 edges.append({
@@ -146,6 +321,7 @@ def build_dependency_graph(batch_analysis: Dict, project_root: str) -> Dict:
     
     return {
         'files': files_info,
+        'in_degree': in_degree,
         'graph': {
             'nodes': nodes,
             'edges': edges
@@ -153,100 +329,361 @@ def build_dependency_graph(batch_analysis: Dict, project_root: str) -> Dict:
     }
 
 
-def detect_circular_dependencies(dependency_graph: Dict) -> List[List[str]]:
+def build_adjacency_matrix(dependency_graph: Dict):
     """
-    Detect circular dependencies in the dependency graph.
+    Build a CSR adjacency matrix over integer file IDs.
+    
+    Row/column i is the i-th file of dependency_graph['files']; entry (i, j)
+    counts how many of file i's imports resolve to file j.
     
     Args:
         dependency_graph: Graph from build_dependency_graph()
         
     Returns:
-        List of circular dependency chains
+        scipy.sparse CSR matrix, or None if scipy is not installed
     """
+    if sparse is None:
+        return None
+    
     files_info = dependency_graph['files']
-    circular_deps = []
+    id_of = {file_path: i for i, file_path in enumerate(files_info)}
+    
+    row = []
+    col = []
+    for i, info in enumerate(files_info.values()):
+        for target in info['imports_resolved']:
+            row.append(i)
+            col.append(id_of[target])
+    
+    n = len(id_of)
+    return sparse.csr_matrix(
+        (np.ones(len(row), dtype=np.int64), (row, col)),
+        shape=(n, n)
+    )
+
+
+def find_strongly_connected_components(successors: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Find strongly connected components with an iterative Tarjan's algorithm.
     
-    def find_cycles(start_file, current_file, visited, path):
-        """DFS to find cycles."""
-        if current_file in path:
-            # Found a cycle
-            cycle_start = path.index(current_file)
-            cycle = path[cycle_start:] + [current_file]
-            if cycle not in circular_deps and list(reversed(cycle)) not in circular_deps:
-                circular_deps.append(cycle)
-            return
+    Args:
+        successors: Mapping of each node to the nodes it points to
         
-        if current_file in visited:
-            return
+    Returns:
+        List of components (each a list of nodes), in reverse topological order
+    """
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    scc_stack = []
+    components = []
+    next_index = 0
+    
+    for root in successors:
+        if root in index:
+            continue
         
-        visited.add(current_file)
-        path.append(current_file)
+        index[root] = lowlink[root] = next_index
+        next_index += 1
+        scc_stack.append(root)
+        on_stack.add(root)
+        work_stack = [(root, iter(successors[root]))]
         
-        # Follow imports
-        if current_file in files_info:
-            for imported_file in files_info[current_file]['imports_resolved']:
-                find_cycles(start_file, imported_file, visited, path[:])
+        while work_stack:
+            node, neighbours = work_stack[-1]
+            
+            for child in neighbours:
+                if child not in successors:
+                    continue
+                if child not in index:
+                    # Descend into the child; resume this node's iterator afterwards
+                    index[child] = lowlink[child] = next_index
+                    next_index += 1
+                    scc_stack.append(child)
+                    on_stack.add(child)
+                    work_stack.append((child, iter(successors[child])))
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            else:
+                # All successors explored: pop the frame and propagate lowlink
+                work_stack.pop()
+                if work_stack:
+                    parent = work_stack[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    
+    return components
+
+
+def _shortest_cycle(start: str, members: Set[str], successors: Dict[str, List[str]]) -> List[str]:
+    """Breadth-first search for the shortest cycle through start within one component."""
+    parents = {start: None}
+    queue = [start]
+    
+    for node in queue:
+        for child in successors[node]:
+            if child == start and node != start:
+                cycle = [start]
+                while node is not None:
+                    cycle.append(node)
+                    node = parents[node]
+                cycle.reverse()
+                return cycle
+            if child in members and child not in parents:
+                parents[child] = node
+                queue.append(child)
+    
+    return [start, start]
+
+
+def canonical_cycle(cycle: List[str]) -> Tuple[str, ...]:
+    """
+    Rotate a cycle so its smallest file comes first, giving a hashable key.
     
-    # Check each file for cycles
-    for file_path in files_info.keys():
-        find_cycles(file_path, file_path, set(), [])
+    Args:
+        cycle: Cycle as a list of files, with the first file repeated at the end
+        
+    Returns:
+        Tuple of the rotated cycle, first file repeated at the end
+    """
+    body = cycle[:-1]
+    min_idx = body.index(min(body))
+    rotated = body[min_idx:] + body[:min_idx]
+    return tuple(rotated + rotated[:1])
+
+
+def _cyclic_components(successors: Dict[str, List[str]], adjacency=None) -> List[List[str]]:
+    """
+    Find the components that can contain cycles: SCCs with more than one
+    file, or a single file importing itself. Files in acyclic (DAG) regions
+    never appear in the result.
+    """
+    if adjacency is None:
+        return [
+            component
+            for component in find_strongly_connected_components(successors)
+            if len(component) > 1 or component[0] in successors[component[0]]
+        ]
+    
+    files = list(successors)
+    n_components, labels = csgraph.connected_components(
+        adjacency, directed=True, connection='strong'
+    )
+    sizes = np.bincount(labels, minlength=n_components)
+    cyclic = (sizes[labels] > 1) | (adjacency.diagonal() > 0)
     
-    return circular_deps
+    grouped = defaultdict(list)
+    for i in np.flatnonzero(cyclic):
+        grouped[labels[i]].append(files[i])
+    return list(grouped.values())
 
 
-def find_orphaned_files(dependency_graph: Dict) -> List[str]:
+def _circular_groups(dependency_graph: Dict, adjacency=None) -> List[Tuple[List[str], List[str]]]:
     """
-    Find files that are not imported by any other file.
+    Pair every circular component's members with one representative cycle.
+    
+    Returns:
+        List of (members, cycle) tuples in project file order, members in
+        file order and the cycle with its first file repeated at the end
+    """
+    files_info = dependency_graph['files']
+    successors = {
+        file_path: info['imports_resolved']
+        for file_path, info in files_info.items()
+    }
+    order = {file_path: i for i, file_path in enumerate(successors)}
+    
+    groups = []
+    for component in _cyclic_components(successors, adjacency):
+        members = sorted(component, key=order.__getitem__)
+        start = members[0]
+        if len(members) > 1:
+            cycle = _shortest_cycle(start, set(members), successors)
+        elif start in successors[start]:
+            cycle = [start, start]
+        else:
+            continue
+        groups.append((members, list(canonical_cycle(cycle))))
+    
+    # Report components in project file order
+    groups.sort(key=lambda group: order[group[0][0]])
+    
+    return groups
+
+
+def detect_circular_dependencies(dependency_graph: Dict, adjacency=None) -> List[List[str]]:
+    """
+    Detect circular dependencies in the dependency graph.
+    
+    Finds strongly connected components in O(V+E), with scipy's csgraph
+    when an adjacency matrix is given and Tarjan's algorithm otherwise:
+    every component with more than one file (or a file importing itself) is
+    circular, and is reported as one representative cycle through it. A
+    component can involve more files than its representative cycle; use
+    find_circular_components() for every member.
     
     Args:
         dependency_graph: Graph from build_dependency_graph()
+        adjacency: Optional matrix from build_adjacency_matrix()
         
     Returns:
-        List of orphaned file paths
+        List of circular dependency chains (first file repeated at the end)
     """
+    return [cycle for _, cycle in _circular_groups(dependency_graph, adjacency)]
+
+
+def find_circular_components(dependency_graph: Dict, adjacency=None) -> List[List[str]]:
+    """
+    Find every file involved in each circular dependency.
+    
+    Args:
+        dependency_graph: Graph from build_dependency_graph()
+        adjacency: Optional matrix from build_adjacency_matrix()
+        
+    Returns:
+        List of circular components (member files in project order), in the
+        same order as detect_circular_dependencies()
+    """
+    return [members for members, _ in _circular_groups(dependency_graph, adjacency)]
+
+
+def enumerate_circular_dependencies(
+    dependency_graph: Dict,
+    adjacency=None,
+    max_cycles: int = 1000
+) -> List[List[str]]:
+    """
+    Enumerate every elementary import cycle, not just one per component.
+    
+    Files outside cyclic strongly connected components are pruned first, and
+    Johnson's algorithm (networkx.simple_cycles) then runs on each remaining
+    component's induced subgraph. The number of cycles can grow
+    exponentially with component density, so enumeration stops at max_cycles.
+    
+    Args:
+        dependency_graph: Graph from build_dependency_graph()
+        adjacency: Optional matrix from build_adjacency_matrix()
+        max_cycles: Maximum number of cycles to return
+        
+    Returns:
+        List of circular dependency chains (first file repeated at the end)
+    """
+    import networkx as nx
+    
     files_info = dependency_graph['files']
-    orphaned = []
+    successors = {
+        file_path: info['imports_resolved']
+        for file_path, info in files_info.items()
+    }
+    order = {file_path: i for i, file_path in enumerate(successors)}
     
-    for file_path, info in files_info.items():
-        # A file is orphaned if nothing imports it
-        # (but it might still be an entry point)
-        if len(info['imported_by']) == 0:
-            orphaned.append(file_path)
+    circular_deps = []
+    seen_cycles = set()
+    for component in _cyclic_components(successors, adjacency):
+        members = set(component)
+        subgraph = nx.DiGraph()
+        subgraph.add_nodes_from(component)
+        subgraph.add_edges_from(
+            (source, target)
+            for source in component
+            for target in successors[source]
+            if target in members
+        )
+        
+        for cycle in nx.simple_cycles(subgraph):
+            canon = canonical_cycle(cycle + cycle[:1])
+            if canon in seen_cycles:
+                continue
+            seen_cycles.add(canon)
+            circular_deps.append(list(canon))
+            if len(circular_deps) >= max_cycles:
+                break
+        
+        if len(circular_deps) >= max_cycles:
+            break
     
-    return orphaned
+    # Report cycles in project file order, shortest first
+    circular_deps.sort(key=lambda cycle: (order[cycle[0]], len(cycle)))
+    
+    return circular_deps
+
+
+def _in_degrees(dependency_graph: Dict, adjacency=None):
+    """Import counts per file, in dependency_graph['files'] order."""
+    in_degree = dependency_graph.get('in_degree')
+    if in_degree is not None:
+        return in_degree
+    if adjacency is not None:
+        return np.asarray(adjacency.sum(axis=0)).ravel().tolist()
+    return [len(info['imported_by']) for info in dependency_graph['files'].values()]
 
 
-def find_hub_files(dependency_graph: Dict, top_n: int = 10) -> List[Tuple[str, int]]:
+def find_orphaned_files(dependency_graph: Dict, adjacency=None) -> List[str]:
+    """
+    Find files that are not imported by any other file.
+    
+    Args:
+        dependency_graph: Graph from build_dependency_graph()
+        adjacency: Optional matrix from build_adjacency_matrix(), used when
+            the graph carries no precomputed in-degrees
+        
+    Returns:
+        List of orphaned file paths
+    """
+    in_degree = _in_degrees(dependency_graph, adjacency)
+    
+    # A file is orphaned if nothing imports it
+    # (but it might still be an entry point)
+    return [
+        file_path
+        for file_path, count in zip(dependency_graph['files'], in_degree)
+        if count == 0
+    ]
+
+
+def find_hub_files(dependency_graph: Dict, top_n: int = 10, adjacency=None) -> List[Tuple[str, int]]:
     """
     Find the most imported files (hub files).
     
     Args:
         dependency_graph: Graph from build_dependency_graph()
         top_n: Number of top files to return
+        adjacency: Optional matrix from build_adjacency_matrix(), used when
+            the graph carries no precomputed in-degrees
         
     Returns:
         List of (file_path, import_count) tuples
     """
-    files_info = dependency_graph['files']
-    
-    files_with_counts = [
-        (file_path, len(info['imported_by']))
-        for file_path, info in files_info.items()
-    ]
-    
-    # Sort by import count descending
-    files_with_counts.sort(key=lambda x: x[1], reverse=True)
-    
-    return files_with_counts[:top_n]
+    in_degree = _in_degrees(dependency_graph, adjacency)
+    
+    # Only the top_n largest import counts are needed, not a full sort
+    # (ties keep project file order)
+    return heapq.nlargest(
+        top_n,
+        zip(dependency_graph['files'], in_degree),
+        key=lambda x: x[1]
+    )
 
 
-def analyze_dependencies(batch_analysis: Dict, project_root: str) -> Dict:
+def analyze_dependencies(batch_analysis: Dict, project_root: str, all_cycles: bool = False) -> Dict:
     """
     Complete dependency analysis of a project.
     
     Args:
         batch_analysis: Results from batch_analyzer.analyze_project()
         project_root: Root directory of the project
+        all_cycles: Also list every elementary import cycle (requires networkx)
+            under 'all_circular_dependencies', not just one per component
         
     Returns:
         Complete dependency analysis including graph, circular deps, orphans, hubs
@@ -254,10 +691,13 @@ def analyze_dependencies(batch_analysis: Dict, project_root: str) -> Dict:
     # Build dependency graph
     dep_graph = build_dependency_graph(batch_analysis, project_root)
     
-    # Detect issues
-    circular_deps = detect_circular_dependencies(dep_graph)
-    orphaned_files = find_orphaned_files(dep_graph)
-    hub_files = find_hub_files(dep_graph)
+    # Detect issues (on a shared sparse adjacency matrix when scipy is available)
+    adjacency = build_adjacency_matrix(dep_graph)
+    circular_groups = _circular_groups(dep_graph, adjacency)
+    circular_deps = [cycle for _, cycle in circular_groups]
+    circular_components = [members for members, _ in circular_groups]
+    orphaned_files = find_orphaned_files(dep_graph, adjacency)
+    hub_files = find_hub_files(dep_graph, adjacency=adjacency)
     
     # Calculate statistics
     total_files = len(dep_graph['files'])
@@ -265,17 +705,14 @@ def analyze_dependencies(batch_analysis: Dict, project_root: str) -> Dict:
     
     files_with_imports = sum(
         1 for info in dep_graph['files'].values()
-        if len(info['imports_resolved']) > 0
-    )
-    
-    files_being_imported = sum(
-        1 for info in dep_graph['files'].values()
-        if len(info['imported_by']) > 0
+        if info['imports_resolved']
     )
+    files_being_imported = total_files - dep_graph['in_degree'].count(0)
     
-    return {
+    results = {
         'dependency_graph': dep_graph,
         'circular_dependencies': circular_deps,
+        'circular_components': circular_components,
         'orphaned_files': orphaned_files,
         'hub_files': hub_files,
         'statistics': {
@@ -284,9 +721,17 @@ def analyze_dependencies(batch_analysis: Dict, project_root: str) -> Dict:
             'files_with_imports': files_with_imports,
             'files_being_imported': files_being_imported,
             'circular_dependency_count': len(circular_deps),
+            'files_in_cycles': sum(len(members) for members in circular_components),
             'orphaned_file_count': len(orphaned_files)
         }
     }
+    
+    if all_cycles:
+        all_circular_deps = enumerate_circular_dependencies(dep_graph, adjacency)
+        results['all_circular_dependencies'] = all_circular_deps
+        results['statistics']['all_cycle_count'] = len(all_circular_deps)
+    
+    return results
 
 
 def get_dependency_summary(dep_analysis: Dict, project_root: str) -> str:
@@ -325,11 +770,27 @@ DEPENDENCY ANALYSIS SUMMARY
     # Circular dependencies
     if dep_analysis['circular_dependencies']:
         summary += f"\n⚠️  Circular Dependencies Found: {len(dep_analysis['circular_dependencies'])}\n"
+        components = dep_analysis.get('circular_components', [])
         for i, cycle in enumerate(dep_analysis['circular_dependencies'][:3], 1):
             cycle_names = [os.path.basename(f) for f in cycle]
             summary += f"  {i}. {' → '.join(cycle_names)}\n"
+            # The cycle shown is one path through the component - list the rest
+            members = components[i - 1] if i <= len(components) else []
+            if len(members) > len(set(cycle)):
+                member_names = ', '.join(os.path.basename(f) for f in members)
+                summary += f"     (all {len(members)} files involved: {member_names})\n"
         if len(dep_analysis['circular_dependencies']) > 3:
             summary += f"  ... and {len(dep_analysis['circular_dependencies']) - 3} more\n"
+        
+        # Every elementary cycle, when requested with all_cycles=True
+        all_cycles = dep_analysis.get('all_circular_dependencies')
+        if all_cycles:
+            summary += f"\n🔁 All Import Cycles: {len(all_cycles)}\n"
+            for i, cycle in enumerate(all_cycles[:5], 1):
+                cycle_names = [os.path.basename(f) for f in cycle]
+                summary += f"  {i}. {' → '.join(cycle_names)}\n"
+            if len(all_cycles) > 5:
+                summary += f"  ... and {len(all_cycles) - 5} more\n"
     else:
         summary += "\n✅ No Circular Dependencies Found\n"
     
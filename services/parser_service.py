@@ -8,10 +8,93 @@ This service uses tree-sitter to deterministically parse code files and extract:
 """
 
 import os
+import functools
+import threading
+from typing import Optional
 from tree_sitter import Parser, Language
 from tree_sitter_languages import get_language, get_parser
 
 
+# File extension to tree-sitter language name
+LANGUAGE_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'javascript',
+    '.tsx': 'typescript'
+}
+
+
+# Tree-sitter queries per language for imports, definitions and calls
+PYTHON_QUERIES = {
+    'imports': """
+        (import_statement
+          name: (dotted_name) @import)
+        (import_from_statement
+          module_name: (dotted_name) @import)
+        """,
+    'definitions': """
+        (function_definition
+          name: (identifier) @name)
+        """,
+    'calls': """
+        (call
+          function: (identifier) @name)
+        (call
+          function: (attribute
+            attribute: (identifier) @name))
+        """
+}
+
+JAVASCRIPT_QUERIES = {
+    'imports': """
+        (import_statement
+          source: (string) @import)
+        """,
+    'definitions': """
+        (function_declaration
+          name: (identifier) @name)
+        (arrow_function) @name
+        (method_definition
+          name: (property_identifier) @name)
+        """,
+    'calls': """
+        (call_expression
+          function: (identifier) @name)
+        (call_expression
+          function: (member_expression
+            property: (property_identifier) @name))
+        """
+}
+
+QUERIES = {
+    'python': PYTHON_QUERIES,
+    'javascript': JAVASCRIPT_QUERIES,
+    'typescript': JAVASCRIPT_QUERIES
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_lang(language: str) -> Language:
+    """Load a tree-sitter grammar once per process."""
+    return get_language(language)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_query(language: str, kind: str):
+    """
+    Compile a language's query once per process.
+    
+    Args:
+        language: One of 'python', 'javascript', or 'typescript'
+        kind: One of 'imports', 'definitions', or 'calls'
+        
+    Returns:
+        The compiled tree-sitter Query
+    """
+    return _get_lang(language).query(QUERIES[language][kind])
+
+
 def get_parser(language: str) -> Parser:
     """
     Get a tree-sitter parser for the specified language.
@@ -23,7 +106,7 @@ def get_parser(language: str) -> Parser:
         A configured Parser instance
     """
     # Get the language grammar
-    lang = get_language(language)
+    lang = _get_lang(language)
     
     # Initialize and configure the parser
     parser = Parser()
@@ -32,12 +115,44 @@ def get_parser(language: str) -> Parser:
     return parser
 
 
-def analyze_code(file_path: str) -> dict:
+# Parsers are reused across files but not shared between threads
+_thread_parsers = threading.local()
+
+
+def _cached_parser(language: str) -> Parser:
+    """Get this thread's parser for a language, creating it on first use."""
+    parsers = getattr(_thread_parsers, 'parsers', None)
+    if parsers is None:
+        parsers = _thread_parsers.parsers = {}
+    
+    parser = parsers.get(language)
+    if parser is None:
+        parser = parsers[language] = get_parser(language)
+    return parser
+
+
+def _ensure_languages_loaded() -> None:
+    """
+    Load every supported grammar up front.
+    
+    Called from analysis worker initializers so the first file a worker
+    parses doesn't also pay for loading the grammar library and compiling
+    the queries.
+    """
+    for language in set(LANGUAGE_MAP.values()):
+        _cached_parser(language)
+        for kind in QUERIES[language]:
+            _get_query(language, kind)
+
+
+def analyze_code(file_path: str, source_bytes: Optional[bytes] = None) -> dict:
     """
     Analyze a code file and extract structural information.
     
     Args:
         file_path: Path to the code file to analyze
+        source_bytes: File content already read by the caller (read from
+            file_path if omitted)
         
     Returns:
         A dictionary with:
@@ -47,118 +162,64 @@ def analyze_code(file_path: str) -> dict:
     """
     # Determine language from file extension
     ext = os.path.splitext(file_path)[1]
-    language_map = {
-        '.py': 'python',
-        '.js': 'javascript',
-        '.ts': 'typescript',
-        '.jsx': 'javascript',
-        '.tsx': 'typescript'
-    }
-    
-    language = language_map.get(ext)
+    language = LANGUAGE_MAP.get(ext)
     if not language:
         raise ValueError(f"Unsupported file extension: {ext}")
     
     # Get the appropriate parser
-    parser = get_parser(language)
+    parser = _cached_parser(language)
     
-    # Read the file content
-    with open(file_path, 'r', encoding='utf-8') as f:
-        code_content = f.read()
+    # Read the file content unless the caller already has it
+    if source_bytes is None:
+        with open(file_path, 'rb') as f:
+            source_bytes = f.read()
     
-    # Parse the code into a syntax tree
-    tree = parser.parse(bytes(code_content, 'utf8'))
+    # Parse the raw bytes; node offsets are byte offsets, so captures slice the bytes too
+    tree = parser.parse(source_bytes)
     root_node = tree.root_node
     
-    # Initialize results
+    # Initialize results (sets mirror the lists for O(1) de-duplication)
     imports = []
     definitions = []
     calls = []
-    
-    # Define language-specific queries
-    if language == 'python':
-        # Python import queries
-        import_query = """
-        (import_statement
-          name: (dotted_name) @import)
-        (import_from_statement
-          module_name: (dotted_name) @import)
-        """
-        
-        # Python function definitions
-        def_query = """
-        (function_definition
-          name: (identifier) @name)
-        """
-        
-        # Python function calls
-        call_query = """
-        (call
-          function: (identifier) @name)
-        (call
-          function: (attribute
-            attribute: (identifier) @name))
-        """
-        
-    else:  # JavaScript/TypeScript
-        # JS/TS import queries
-        import_query = """
-        (import_statement
-          source: (string) @import)
-        """
-        
-        # JS/TS function definitions
-        def_query = """
-        (function_declaration
-          name: (identifier) @name)
-        (arrow_function) @name
-        (method_definition
-          name: (property_identifier) @name)
-        """
-        
-        # JS/TS function calls
-        call_query = """
-        (call_expression
-          function: (identifier) @name)
-        (call_expression
-          function: (member_expression
-            property: (property_identifier) @name))
-        """
-    
-    # Execute queries and extract results
-    lang = get_language(language)
+    imports_seen = set()
+    definitions_seen = set()
+    calls_seen = set()
     
     # Extract imports
     try:
-        query = lang.query(import_query)
+        query = _get_query(language, 'imports')
         captures = query.captures(root_node)
         for node, _ in captures:
-            text = code_content[node.start_byte:node.end_byte]
+            text = source_bytes[node.start_byte:node.end_byte].decode('utf-8', errors='replace')
             # Clean up the text (remove quotes for JS/TS imports)
             text = text.strip('"').strip("'")
-            if text and text not in imports:
+            if text and text not in imports_seen:
+                imports_seen.add(text)
                 imports.append(text)
     except Exception as e:
         print(f"Warning: Could not parse imports: {e}")
     
     # Extract function definitions
     try:
-        query = lang.query(def_query)
+        query = _get_query(language, 'definitions')
         captures = query.captures(root_node)
         for node, _ in captures:
-            text = code_content[node.start_byte:node.end_byte]
-            if text and text not in definitions:
+            text = source_bytes[node.start_byte:node.end_byte].decode('utf-8', errors='replace')
+            if text and text not in definitions_seen:
+                definitions_seen.add(text)
                 definitions.append(text)
     except Exception as e:
         print(f"Warning: Could not parse function definitions: {e}")
     
     # Extract function calls
     try:
-        query = lang.query(call_query)
+        query = _get_query(language, 'calls')
         captures = query.captures(root_node)
         for node, _ in captures:
-            text = code_content[node.start_byte:node.end_byte]
-            if text and text not in calls and text not in definitions:
+            text = source_bytes[node.start_byte:node.end_byte].decode('utf-8', errors='replace')
+            if text and text not in calls_seen and text not in definitions_seen:
+                calls_seen.add(text)
                 calls.append(text)
     except Exception as e:
         print(f"Warning: Could not parse function calls: {e}")
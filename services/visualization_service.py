@@ -12,10 +12,20 @@ import os
 import json
 from pathlib import Path
 from typing import Dict, List, Optional
+import numpy as np
 import networkx as nx
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+try:
+    import orjson
+    
+    def _dumps_indented(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
 
 def create_network_graph(dependency_analysis: Dict, project_root: str) -> nx.DiGraph:
     """
@@ -60,6 +70,178 @@ def create_network_graph(dependency_analysis: Dict, project_root: str) -> nx.DiG
     return G
 
 
+def energy_layout(
+    G: nx.Graph,
+    pos: Optional[Dict] = None,
+    k: Optional[float] = None,
+    maxiter: int = 50,
+    scale: float = 2.0,
+    center=(0, 0),
+    seed: int = 0
+) -> Dict:
+    """
+    Compute node positions by minimizing a spring energy with L-BFGS.
+    
+    The energy is quadratic attraction along edges, logarithmic repulsion
+    between every pair of nodes and a pull towards the origin so that
+    disconnected files do not drift away:
+    
+        E(x) = sum_edges ||xi - xj||^2 - k^2 * sum_i<j log ||xi - xj||
+               + k^2 * n * sum_i ||xi||^2
+    
+    The pull grows with the total repulsion (k^2 * n) - a fixed constant is
+    swamped on larger graphs, pushing isolated files out to the edge where
+    they dominate the final rescale and squeeze the connected files together.
+    
+    Args:
+        G: NetworkX graph to lay out
+        pos: Optional initial positions for some or all nodes (warm start)
+        k: Optimal distance between nodes (default: 1/sqrt(n))
+        maxiter: Maximum number of L-BFGS iterations
+        scale: Scale factor for the final positions
+        center: Center of the final layout
+        seed: Seed for the random initial positions of nodes not in pos
+        
+    Returns:
+        Dictionary mapping each node to an (x, y) position array
+    """
+    from scipy.optimize import minimize
+    
+    nodes = list(G.nodes())
+    n = len(nodes)
+    if n == 0:
+        return {}
+    if n == 1:
+        return {nodes[0]: np.asarray(center, dtype=float)}
+    
+    if k is None:
+        k = 1.0 / np.sqrt(n)
+    k2 = k * k
+    gravity = k2 * n
+    
+    # Symmetric adjacency: an import in either direction pulls both files together
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, dtype=float, format='csr')
+    S = (A + A.T).tocsr()
+    degree = np.asarray(S.sum(axis=1)).ravel()
+    
+    def energy(flat):
+        x = flat.reshape(n, 2)
+        sq = np.einsum('ij,ij->i', x, x)
+        
+        # Attraction: sum over edges of ||xi - xj||^2 == x^T L x (per axis)
+        Sx = S @ x
+        attraction = np.sum(degree * sq) - np.sum(x * Sx)
+        grad = 2.0 * (degree[:, None] * x - Sx)
+        
+        # Repulsion: -k^2 * sum_i<j log ||xi - xj|| == -k^2/4 * sum_i!=j log d2_ij
+        d2 = sq[:, None] + sq[None, :] - 2.0 * (x @ x.T)
+        np.maximum(d2, 1e-9, out=d2)
+        np.fill_diagonal(d2, 1.0)
+        repulsion = -0.25 * k2 * np.sum(np.log(d2))
+        inv = 1.0 / d2
+        np.fill_diagonal(inv, 0.0)
+        grad -= k2 * (inv.sum(axis=1)[:, None] * x - inv @ x)
+        
+        # Gravity keeps isolated nodes close to the rest of the graph
+        attraction += gravity * np.sum(sq)
+        grad += 2.0 * gravity * x
+        
+        return attraction + repulsion, grad.ravel()
+    
+    x0 = np.random.default_rng(seed).standard_normal((n, 2))
+    if pos:
+        for i, node in enumerate(nodes):
+            if node in pos:
+                x0[i] = pos[node]
+    result = minimize(
+        energy,
+        x0.ravel(),
+        jac=True,
+        method='L-BFGS-B',
+        options={'maxiter': maxiter}
+    )
+    
+    pos_arr = nx.rescale_layout(result.x.reshape(n, 2), scale=scale) + np.asarray(center)
+    return dict(zip(nodes, pos_arr))
+
+
+def barnes_hut_layout(
+    G: nx.Graph,
+    pos: Optional[Dict] = None,
+    iterations: int = 100,
+    scale: float = 2.0,
+    center=(0, 0)
+) -> Dict:
+    """
+    Compute node positions with ForceAtlas2 using Barnes-Hut approximation.
+    
+    Long-range repulsion is aggregated through a quadtree, so each iteration
+    costs O(N log N) instead of the O(N^2) all-pairs repulsion of spring_layout.
+    
+    Args:
+        G: NetworkX graph to lay out
+        pos: Optional initial positions for some or all nodes (warm start)
+        iterations: Number of ForceAtlas2 iterations
+        scale: Scale factor for the final positions
+        center: Center of the final layout
+        
+    Returns:
+        Dictionary mapping each node to an (x, y) position array
+        
+    Raises:
+        ImportError: If neither fa2-modified nor fa2 is installed
+    """
+    try:
+        from fa2_modified import ForceAtlas2
+    except ImportError:
+        from fa2 import ForceAtlas2
+    
+    forceatlas2 = ForceAtlas2(
+        barnesHutOptimize=True,
+        barnesHutTheta=1.2,
+        verbose=False
+    )
+    
+    # ForceAtlas2 needs a symmetric adjacency matrix
+    U = G.to_undirected()
+    if pos:
+        pos = {node: tuple(pos[node]) for node in U if node in pos}
+        if len(pos) < len(U):
+            pos = None
+    
+    pos = forceatlas2.forceatlas2_networkx_layout(U, pos=pos or None, iterations=iterations)
+    
+    nodes = list(U.nodes())
+    pos_arr = np.array([pos[node] for node in nodes], dtype=float)
+    pos_arr = nx.rescale_layout(pos_arr, scale=scale) + np.asarray(center)
+    return dict(zip(nodes, pos_arr))
+
+
+# Above this many nodes, spring_layout's O(N^2) iterations dominate rendering
+LARGE_GRAPH_THRESHOLD = 300
+
+# Node colors by file extension
+NODE_COLORS = {
+    '.py': '#3776ab',  # Python blue
+    '.js': '#f7df1e',  # JavaScript yellow
+    '.ts': '#3178c6',  # TypeScript blue
+    '.jsx': '#61dafb', # React cyan
+    '.tsx': '#61dafb'  # React cyan
+}
+DEFAULT_NODE_COLOR = '#888888'
+
+# Node hover text, filled from each node's customdata in the browser
+NODE_HOVER_TEMPLATE = (
+    "<b>%{customdata[0]}</b><br>"
+    "Path: %{customdata[1]}<br>"
+    "Exports: %{customdata[2]} functions<br>"
+    "Imports: %{customdata[3]} files<br>"
+    "Imported by: %{customdata[4]} files<br>"
+    "Calls: %{customdata[5]}<br>"
+    "<extra></extra>"
+)
+
+
 def get_node_color(file_path: str) -> str:
     """
     Get color for node based on file type.
@@ -70,15 +252,7 @@ def get_node_color(file_path: str) -> str:
     Returns:
         Color string for the node
     """
-    ext = os.path.splitext(file_path)[1]
-    color_map = {
-        '.py': '#3776ab',  # Python blue
-        '.js': '#f7df1e',  # JavaScript yellow
-        '.ts': '#3178c6',  # TypeScript blue
-        '.jsx': '#61dafb', # React cyan
-        '.tsx': '#61dafb'  # React cyan
-    }
-    return color_map.get(ext, '#888888')
+    return NODE_COLORS.get(os.path.splitext(file_path)[1], DEFAULT_NODE_COLOR)
 
 
 def generate_dependency_graph(
@@ -94,7 +268,8 @@ def generate_dependency_graph(
     Args:
         dependency_analysis: Results from dependency_analyzer.analyze_dependencies()
         project_root: Root directory of the project
-        layout: Layout algorithm ('spring', 'circular', 'kamada_kawai')
+        layout: Layout algorithm ('spring', 'circular', 'kamada_kawai'); 'spring'
+            uses graphviz sfdp or ForceAtlas2 above LARGE_GRAPH_THRESHOLD nodes
         width: Width of the visualization
         height: Height of the visualization
         
@@ -119,62 +294,72 @@ def generate_dependency_graph(
         pos = nx.circular_layout(G)
     elif layout == 'kamada_kawai':
         pos = nx.kamada_kawai_layout(G)
-    else:  # spring (default)
-        pos = nx.spring_layout(G, k=0.5, iterations=50)
-    
-    # Create edge traces
-    edge_traces = []
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        
-        edge_trace = go.Scatter(
-            x=[x0, x1, None],
-            y=[y0, y1, None],
-            mode='lines',
-            line=dict(width=0.5, color='#888'),
-            hoverinfo='none',
-            showlegend=False
-        )
-        edge_traces.append(edge_trace)
-    
-    # Create node trace
-    node_x = []
-    node_y = []
-    node_text = []
-    node_color = []
-    node_size = []
-    
-    for node in G.nodes():
-        x, y = pos[node]
-        node_x.append(x)
-        node_y.append(y)
-        
-        attrs = G.nodes[node]
-        
-        # Create hover text
-        hover_text = f"<b>{attrs['file_name']}</b><br>"
-        hover_text += f"Path: {attrs['rel_path']}<br>"
-        hover_text += f"Exports: {attrs['exports_count']} functions<br>"
-        hover_text += f"Imports: {attrs['imports_count']} files<br>"
-        hover_text += f"Imported by: {attrs['imported_by_count']} files<br>"
-        hover_text += f"Calls: {attrs['calls_count']}<br>"
-        node_text.append(hover_text)
-        
-        # Color by file type
-        node_color.append(get_node_color(node))
-        
-        # Size by number of functions + imports
-        size = 10 + (attrs['exports_count'] * 2) + attrs['imported_by_count']
-        node_size.append(min(size, 50))  # Cap at 50
+    else:  # spring (default), with faster force-directed layouts for large graphs
+        pos = None
+        if len(G) > LARGE_GRAPH_THRESHOLD:
+            try:
+                pos = nx.nx_agraph.graphviz_layout(G, prog='sfdp')
+            except (ImportError, OSError):
+                try:
+                    pos = barnes_hut_layout(G)
+                except ImportError:
+                    pos = None
+        if pos is None:
+            # Fixed seed keeps re-renders of the same project stable
+            pos = nx.spring_layout(G, k=0.5, iterations=50, seed=42)
+    
+    # Create a single edge trace; None breaks the line between segments
+    edge_x = []
+    edge_y = []
+    for source, target in G.edges():
+        x0, y0 = pos[source]
+        x1, y1 = pos[target]
+        edge_x += [x0, x1, None]
+        edge_y += [y0, y1, None]
+    
+    edge_trace = go.Scatter(
+        x=edge_x,
+        y=edge_y,
+        mode='lines',
+        line=dict(width=0.5, color='#888'),
+        hoverinfo='none',
+        showlegend=False
+    )
+    
+    # Create node trace from per-node vectors
+    node_list = list(G.nodes())
+    attrs = [G.nodes[node] for node in node_list]
+    pos_arr = np.array([pos[node] for node in node_list], dtype=float)
+    node_x = pos_arr[:, 0].tolist()
+    node_y = pos_arr[:, 1].tolist()
+    
+    # Hover fields per node - plotly formats them client-side on hover
+    node_customdata = [
+        [
+            a['file_name'], a['rel_path'], a['exports_count'],
+            a['imports_count'], a['imported_by_count'], a['calls_count']
+        ]
+        for a in attrs
+    ]
+    
+    # Color by file type
+    node_color = [
+        NODE_COLORS.get(os.path.splitext(node)[1], DEFAULT_NODE_COLOR)
+        for node in node_list
+    ]
+    
+    # Size by number of functions + imports, capped at 50
+    exports = np.array([a['exports_count'] for a in attrs], dtype=np.int64)
+    imported_by = np.array([a['imported_by_count'] for a in attrs], dtype=np.int64)
+    node_size = np.minimum(10 + exports * 2 + imported_by, 50).tolist()
     
     node_trace = go.Scatter(
         x=node_x,
         y=node_y,
         mode='markers+text',
-        hoverinfo='text',
-        text=[G.nodes[node]['file_name'] for node in G.nodes()],
-        hovertext=node_text,
+        text=[a['file_name'] for a in attrs],
+        customdata=node_customdata,
+        hovertemplate=NODE_HOVER_TEMPLATE,
         textposition='top center',
         textfont=dict(size=8),
         marker=dict(
@@ -189,8 +374,7 @@ def generate_dependency_graph(
     fig = go.Figure()
     
     # Add edges first (so they're behind nodes)
-    for edge_trace in edge_traces:
-        fig.add_trace(edge_trace)
+    fig.add_trace(edge_trace)
     
     # Add nodes
     fig.add_trace(node_trace)
@@ -289,8 +473,8 @@ def export_graph_json(
         'statistics': dependency_analysis['statistics']
     }
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(graph_data, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(_dumps_indented(graph_data))
     
     print(f"📄 Graph JSON saved to: {output_file}")
 
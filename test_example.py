@@ -6,9 +6,189 @@ It contains a mix of imports, function definitions, and function calls.
 """
 
 import os
+import array
 import json
-from typing import List, Dict, Optional
-from datetime import datetime
+import mmap
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence
+from datetime import datetime, timezone
+
+# JSON library for configs and reports: 'auto' (orjson, then ujson, then
+# the stdlib), or force one with CC_JSON=orjson|ujson|simdjson|stdlib.
+# simdjson only parses configs; reports are written with the 'auto' choice
+JSON_BACKEND = os.getenv('CC_JSON', 'auto').lower()
+
+orjson = ujson = simdjson = None
+if JSON_BACKEND == 'simdjson':
+    try:
+        import simdjson
+    except ImportError:
+        simdjson = None
+if JSON_BACKEND in ('auto', 'orjson', 'simdjson'):
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+if orjson is None and JSON_BACKEND in ('auto', 'ujson', 'simdjson'):
+    try:
+        import ujson
+    except ImportError:
+        ujson = None
+
+
+def _json_default(obj):
+    """Convert NumPy scalars/arrays and datetimes for the non-orjson backends."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if isinstance(obj, datetime):
+        # Naive datetimes are UTC, matching orjson's OPT_NAIVE_UTC
+        return (obj.replace(tzinfo=timezone.utc) if obj.tzinfo is None else obj).isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _loads = orjson.loads
+    
+    def _dumps_indented(obj) -> bytes:
+        # NumPy scalars/arrays and naive datetimes serialize natively
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+        )
+elif ujson is not None:
+    def _loads(data) -> Dict:
+        return ujson.loads(bytes(data))
+    
+    def _dumps_indented(obj) -> bytes:
+        return ujson.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+else:
+    def _loads(data) -> Dict:
+        # bytes() is a no-op for bytes and copies mapped buffers, which json can't read
+        return json.loads(bytes(data))
+    
+    def _dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=_json_default).encode('utf-8')
+
+if simdjson is not None:
+    # Each thread reuses its own parser, which keeps its buffers allocated
+    _simdjson_local = threading.local()
+    
+    def _loads(data) -> Dict:
+        parser = getattr(_simdjson_local, 'parser', None)
+        if parser is None:
+            parser = _simdjson_local.parser = simdjson.Parser()
+        
+        # Materialize the document, since the parser's next parse invalidates it
+        doc = parser.parse(data)
+        if isinstance(doc, simdjson.Object):
+            return doc.as_dict()
+        if isinstance(doc, simdjson.Array):
+            return doc.as_list()
+        return doc
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Below this many values, converting to an array costs more than the builtins save
+NUMERIC_KERNEL_THRESHOLD = 64
+
+INT64_MAX = 2 ** 63 - 1
+
+
+if np is not None and numba is not None:
+    # Explicit signatures compile eagerly at import, so the first call pays no JIT cost
+    @numba.njit('i8(i8[:])', cache=True)
+    def _sum_kernel(a):
+        total = 0
+        for i in range(a.size):
+            total += a[i]
+        return total
+    
+    @numba.njit('i8(i8[:])', cache=True)
+    def _max_kernel(a):
+        result = a[0]
+        for i in range(1, a.size):
+            if a[i] > result:
+                result = a[i]
+        return result
+    
+    @numba.njit('i8(i8[:])', cache=True)
+    def _min_kernel(a):
+        result = a[0]
+        for i in range(1, a.size):
+            if a[i] < result:
+                result = a[i]
+        return result
+    
+    @numba.njit('i8(i8[:])', cache=True)
+    def _avg_kernel(a):
+        total = 0
+        for i in range(a.size):
+            total += a[i]
+        return total // a.size
+    
+    @numba.njit('UniTuple(i8, 3)(i8[:])', cache=True)
+    def _stats_kernel(a):
+        total = 0
+        low = high = a[0]
+        for i in range(a.size):
+            x = a[i]
+            total += x
+            if x < low:
+                low = x
+            elif x > high:
+                high = x
+        return total, low, high
+    
+    _KERNELS = {
+        'sum': _sum_kernel,
+        'max': _max_kernel,
+        'min': _min_kernel,
+        'avg': _avg_kernel,
+    }
+elif np is not None:
+    # NumPy's C reductions over a contiguous int64 buffer
+    _KERNELS = {
+        'sum': np.ndarray.sum,
+        'max': np.ndarray.max,
+        'min': np.ndarray.min,
+        'avg': lambda a: a.sum() // a.size,
+    }
+else:
+    _KERNELS = None
+
+# Pure-Python operations, resolved by a single dict lookup per call
+_OPERATIONS = {
+    'sum': sum,
+    'max': max,
+    'min': min,
+    'avg': lambda data: sum(data) // len(data) if len(data) else 0,
+}
+
+
+# Config files at least this large are parsed from a memory map instead of a copy
+CONFIG_MMAP_THRESHOLD = 1024 * 1024
+
+# Parsed configs keyed by (absolute path, mtime_ns, size), least recently used first
+CONFIG_CACHE_SIZE = 128
+_config_cache = OrderedDict()
+
+
+def _open_config(file_path: str):
+    """Open a config file, opening it directly instead of checking existence first."""
+    try:
+        return open(file_path, 'rb')
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Configuration file not found: {file_path}") from e
 
 
 def load_config(file_path: str) -> Dict:
@@ -19,40 +199,115 @@ def load_config(file_path: str) -> Dict:
         file_path: Path to the JSON configuration file
         
     Returns:
-        Dictionary containing configuration data
+        Dictionary containing configuration data. Repeated loads of an
+        unchanged file return the same cached dictionary, so treat it as
+        read-only.
         
     Raises:
         FileNotFoundError: If the config file doesn't exist
-        json.JSONDecodeError: If the file contains invalid JSON
+        ValueError: If the file contains invalid JSON (json.JSONDecodeError
+            unless the ujson or simdjson backend is in use)
+    """
+    with _open_config(file_path) as f:
+        stat = os.fstat(f.fileno())
+        key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        config = _config_cache.get(key)
+        if config is not None:
+            _config_cache.move_to_end(key)
+            return config
+        
+        if stat.st_size < CONFIG_MMAP_THRESHOLD:
+            config = _loads(f.read())
+        else:
+            # Large files: parse straight from the page cache without a bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    config = _loads(view)
+    
+    _config_cache[key] = config
+    if len(_config_cache) > CONFIG_CACHE_SIZE:
+        _config_cache.popitem(last=False)
+    
+    return config
+
+
+def _kernel_input(data: Sequence[int], sums: bool):
+    """
+    View data as an int64 array for the numeric kernels, or return None.
+    
+    Only integer input qualifies - floats, bools and ints beyond int64 keep
+    Python's exact semantics. When the kernel sums, the input also has to
+    be small enough that no partial sum can wrap around int64.
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Configuration file not found: {file_path}")
+    values = np.asarray(data)
+    if values.ndim != 1 or values.dtype.kind not in 'iu':
+        return None
     
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    high = int(values.max())
+    if high > INT64_MAX:
+        return None
+    if sums and max(high, -int(values.min())) * values.size > INT64_MAX:
+        return None
+    
+    return values.astype(np.int64, copy=False)
 
 
-def process_data(data: List[int], operation: str = 'sum') -> int:
+def process_data(data: Sequence[int], operation: str = 'sum') -> int:
     """
     Process a list of integers with the specified operation.
     
     Args:
-        data: List of integers to process
+        data: Integers to process (list, array.array or int64 ndarray)
         operation: Operation to perform ('sum', 'max', 'min', 'avg')
         
     Returns:
         Result of the operation
     """
-    if operation == 'sum':
-        return sum(data)
-    elif operation == 'max':
-        return max(data)
-    elif operation == 'min':
-        return min(data)
-    elif operation == 'avg':
-        return sum(data) // len(data) if data else 0
-    else:
-        raise ValueError(f"Unknown operation: {operation}")
+    try:
+        operation_func = _OPERATIONS[operation]
+    except KeyError:
+        raise ValueError(f"Unknown operation: {operation}") from None
+    
+    if _KERNELS is not None and len(data) >= NUMERIC_KERNEL_THRESHOLD:
+        values = _kernel_input(data, sums=operation in ('sum', 'avg'))
+        if values is not None:
+            return int(_KERNELS[operation](values))
+    
+    return operation_func(data)
+
+
+def process_data_all(data: Sequence[int]) -> Dict[str, int]:
+    """
+    Compute sum, max, min and avg of a list of integers in a single pass.
+    
+    Args:
+        data: Non-empty sequence of integers to process
+        
+    Returns:
+        Dictionary with 'sum', 'max', 'min' and 'avg' keys
+        
+    Raises:
+        ValueError: If data is empty
+    """
+    if not len(data):
+        raise ValueError("process_data_all() requires at least one value")
+    
+    if numba is not None and np is not None and len(data) >= NUMERIC_KERNEL_THRESHOLD:
+        values = _kernel_input(data, sums=True)
+        if values is not None:
+            total, low, high = _stats_kernel(values)
+            return {'sum': total, 'max': high, 'min': low, 'avg': total // len(data)}
+    
+    total = 0
+    low = high = data[0]
+    for x in data:
+        total += x
+        if x < low:
+            low = x
+        elif x > high:
+            high = x
+    
+    return {'sum': total, 'max': high, 'min': low, 'avg': total // len(data)}
 
 
 def validate_input(value: Optional[int]) -> bool:
@@ -68,6 +323,58 @@ def validate_input(value: Optional[int]) -> bool:
     return value is not None and value > 0
 
 
+if numba is not None and np is not None:
+    @numba.vectorize(['b1(i8)', 'b1(i4)'], cache=True)
+    def validate_input_vec(value):
+        """Element-wise validate_input() over an integer array, compiled to a ufunc."""
+        return value > 0
+else:
+    def validate_input_vec(values):
+        """
+        Validate many inputs at once.
+        
+        Args:
+            values: Array or list of integers to validate
+            
+        Returns:
+            Boolean array (or list without NumPy), True where the value is positive
+        """
+        if np is not None:
+            return np.greater(values, 0)
+        return [validate_input(value) for value in values]
+
+
+# (UTC day number, 'YYYY-MM-DDT' prefix) of the last formatted timestamp
+_cached_date = (None, '')
+
+MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+def utc_timestamp() -> str:
+    """
+    Format the current UTC time like datetime.now(timezone.utc).isoformat().
+    
+    The date prefix is formatted once per day; the time of day is built
+    with integer math instead of allocating a datetime per call.
+    
+    Returns:
+        ISO 8601 timestamp with a +00:00 offset
+    """
+    global _cached_date
+    
+    day, micros = divmod(time.time_ns() // 1000, MICROSECONDS_PER_DAY)
+    if day != _cached_date[0]:
+        date = datetime.fromtimestamp(day * 86400, tz=timezone.utc)
+        _cached_date = (day, date.strftime('%Y-%m-%dT'))
+    
+    seconds, micros = divmod(micros, 1_000_000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    fraction = f".{micros:06d}" if micros else ""
+    
+    return f"{_cached_date[1]}{hours:02d}:{minutes:02d}:{seconds:02d}{fraction}+00:00"
+
+
 def generate_report(data: Dict, output_path: str) -> None:
     """
     Generate a report from the processed data.
@@ -76,7 +383,7 @@ def generate_report(data: Dict, output_path: str) -> None:
         data: Dictionary containing report data
         output_path: Path where the report should be saved
     """
-    timestamp = datetime.now().isoformat()
+    timestamp = utc_timestamp()
     
     report = {
         'generated_at': timestamp,
@@ -84,50 +391,64 @@ def generate_report(data: Dict, output_path: str) -> None:
         'version': '1.0.0'
     }
     
-    with open(output_path, 'w') as f:
-        json.dump(report, f, indent=2)
+    # One pre-encoded buffer written straight to the descriptor
+    payload = memoryview(_dumps_indented(report))
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
     
     print(f"Report generated at: {output_path}")
 
 
+def _run_example() -> None:
+    """Run the example workload; errors propagate to main()."""
+    # Load configuration (would fail since file doesn't exist, but shows intent)
+    # config = load_config('config.json')
+    
+    # Process some sample data (packed int64s, viewed by NumPy without a copy)
+    sample_data = array.array('q', [1, 2, 3, 4, 5, 10, 15, 20])
+    
+    stats = process_data_all(sample_data)
+    total = stats['sum']
+    maximum = stats['max']
+    minimum = stats['min']
+    average = stats['avg']
+    
+    # Validate some inputs
+    is_valid = validate_input(total)
+    
+    # One write for all result lines instead of a print per line
+    print(
+        f"Sum: {total}\n"
+        f"Max: {maximum}\n"
+        f"Min: {minimum}\n"
+        f"Avg: {average}\n"
+        f"Result is valid: {is_valid}"
+    )
+    
+    # Generate a report
+    report_data = {
+        'sum': total,
+        'max': maximum,
+        'min': minimum,
+        'avg': average
+    }
+    
+    # generate_report(report_data, 'report.json')
+    
+    print("✅ Example completed successfully!")
+    
+
 def main():
     """Main entry point for the application."""
     print("Starting Code Cartographer test example...")
     
     # Example usage
     try:
-        # Load configuration (would fail since file doesn't exist, but shows intent)
-        # config = load_config('config.json')
-        
-        # Process some sample data
-        sample_data = [1, 2, 3, 4, 5, 10, 15, 20]
-        
-        total = process_data(sample_data, 'sum')
-        maximum = process_data(sample_data, 'max')
-        minimum = process_data(sample_data, 'min')
-        average = process_data(sample_data, 'avg')
-        
-        print(f"Sum: {total}")
-        print(f"Max: {maximum}")
-        print(f"Min: {minimum}")
-        print(f"Avg: {average}")
-        
-        # Validate some inputs
-        is_valid = validate_input(total)
-        print(f"Result is valid: {is_valid}")
-        
-        # Generate a report
-        report_data = {
-            'sum': total,
-            'max': maximum,
-            'min': minimum,
-            'avg': average
-        }
-        
-        # generate_report(report_data, 'report.json')
-        
-        print("✅ Example completed successfully!")
-        
+        _run_example()
     except Exception as e:
         print(f"❌ Error: {e}")
         raise
@@ -135,6 +456,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
-
-